@@ -2,8 +2,30 @@
 import os
 import sys
 import random
+import functools
 import pandas as pd
 
+# Prefer the Rust-backed calamine engine when it is installed (pip install python-calamine)
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None
+
+# Set RK_DEBUG=1 to print the chosen row on every run
+_DEBUG = os.environ.get("RK_DEBUG") == "1"
+
+# Spaces plus standard and fancy quotes, stripped from both ends of a row
+_TRIM_CHARS = ' "“”'
+
+@functools.lru_cache(maxsize=8)
+def _load_excel(file_path, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key, so a rewritten file is parsed again
+    df = pd.read_excel(file_path, header=None, engine=_EXCEL_ENGINE)
+    # Plain 2D object array so reading a row is a slice instead of an iloc lookup,
+    # plus a {delimiter: [joined row text]} dict filled on first use of each delimiter
+    return df, df.to_numpy(dtype=object), {}
+
 class RK_Excel_File_State_Looper:
     @classmethod
     def INPUT_TYPES(cls):
@@ -44,43 +66,94 @@ class RK_Excel_File_State_Looper:
     FUNCTION = "read_row"
     CATEGORY = "RK_tools_v02"
 
-    df_cache = None
-    df_path = None
+    # Shuffled index order per (start_index, end_index) for random mode: {key: [perm, position]}
+    _perm_cache = {}
+
+    # State file path per (file_path, start_index, end_index, step_size, loop_mode)
+    _state_path_cache = {}
+
+    # Increment-mode index per state file, with the file's (mtime_ns, size) when it was
+    # last read or written: {state_file: (index, mtime_ns, size)}. The file is read again
+    # only when it changed on disk, so editing or deleting it still resets the loop
+    _index_state = {}
 
     def load_excel(self, file_path):
-        # Cache the DataFrame to avoid reloading on each call
-        if RK_Excel_File_State_Looper.df_path != file_path:
-            if not os.path.isfile(file_path):
-                raise FileNotFoundError(f"Excel file not found: {file_path}")
-            RK_Excel_File_State_Looper.df_cache = pd.read_excel(file_path, header=None)
-            RK_Excel_File_State_Looper.df_path = file_path
-        return RK_Excel_File_State_Looper.df_cache
+        # Cache the DataFrame (and its row array) per file version to avoid reloading on each call
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Excel file not found: {file_path}")
+        return _load_excel(file_path, st.st_mtime_ns, st.st_size)
+
+    def get_joined_rows(self, rows, joined_by_delimiter, delimiter):
+        # Join every row once per delimiter so read_row is a plain list lookup
+        joined = joined_by_delimiter.get(delimiter)
+        if joined is None:
+            joined = [delimiter.join(map(str, row)) for row in rows]
+            joined_by_delimiter[delimiter] = joined
+        return joined
 
     def get_row_count(self, df):
         return len(df)
 
+    def next_random_index(self, start_index, end_index):
+        # Walk a shuffled permutation of the range so every row comes up once before any repeats
+        key = (start_index, end_index)
+        state = RK_Excel_File_State_Looper._perm_cache.get(key)
+        if state is None:
+            perm = list(range(start_index, end_index + 1))
+            random.shuffle(perm)
+            state = [perm, 0]
+            RK_Excel_File_State_Looper._perm_cache[key] = state
+
+        perm, pos = state
+        chosen_index = perm[pos]
+        pos += 1
+        if pos >= len(perm):
+            # Full pass done, reshuffle for the next one
+            random.shuffle(perm)
+            pos = 0
+        state[1] = pos
+        return chosen_index
+
     def get_state_file_path(self, file_path, start_index, end_index, step_size, loop_mode):
-        base, ext = os.path.splitext(file_path)
-        state_file = f"{base}_state_{loop_mode}_{start_index}_{end_index}_{step_size}.txt"
+        key = (file_path, start_index, end_index, step_size, loop_mode)
+        state_file = RK_Excel_File_State_Looper._state_path_cache.get(key)
+        if state_file is None:
+            base, ext = os.path.splitext(file_path)
+            state_file = f"{base}_state_{loop_mode}_{start_index}_{end_index}_{step_size}.txt"
+            RK_Excel_File_State_Looper._state_path_cache[key] = state_file
         return state_file
 
     def read_current_index(self, state_file, start_index):
-        if os.path.isfile(state_file):
-            try:
-                with open(state_file, 'r', encoding='utf-8') as f:
-                    val = f.read().strip()
-                    return int(val)
-            except:
-                pass
-        return start_index
+        try:
+            st = os.stat(state_file)
+        except OSError:
+            # No saved position yet (or deleted to reset the loop): start from the beginning
+            return start_index
+        cached = RK_Excel_File_State_Looper._index_state.get(state_file)
+        if cached is not None and cached[1] == st.st_mtime_ns and cached[2] == st.st_size:
+            return cached[0]
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                index = int(f.read().strip())
+        except (OSError, ValueError):
+            # Unreadable: start from the beginning
+            return start_index
+        RK_Excel_File_State_Looper._index_state[state_file] = (index, st.st_mtime_ns, st.st_size)
+        return index
 
     def write_current_index(self, state_file, index):
+        # Written on every update, so a crash never loses the position
         with open(state_file, 'w', encoding='utf-8') as f:
             f.write(str(index))
+            f.flush()
+            st = os.fstat(f.fileno())
+        RK_Excel_File_State_Looper._index_state[state_file] = (index, st.st_mtime_ns, st.st_size)
 
     def read_row(self, file_path, loop_mode, start_index, end_index, step_size, delimiter):
         try:
-            df = self.load_excel(file_path)
+            df, rows, joined_by_delimiter = self.load_excel(file_path)
             total_rows = self.get_row_count(df)
 
             # Adjust indices if out of range
@@ -99,7 +172,7 @@ class RK_Excel_File_State_Looper:
                 chosen_index = start_index
 
             elif loop_mode == "random":
-                chosen_index = random.randint(start_index, end_index)
+                chosen_index = self.next_random_index(start_index, end_index)
 
             elif loop_mode == "increment":
                 current_index = self.read_current_index(state_file, start_index)
@@ -112,16 +185,17 @@ class RK_Excel_File_State_Looper:
             else:
                 chosen_index = start_index
 
-            row_data = df.iloc[chosen_index].tolist()
-            row_text = delimiter.join(map(str, row_data))
+            row_text = self.get_joined_rows(rows, joined_by_delimiter, delimiter)[chosen_index]
 
-            # Remove leading/trailing quotes (standard and fancy quotes)
-            row_text = row_text.strip(' "“”')
+            # Remove leading/trailing quotes (standard and fancy quotes), only if either end has one
+            if row_text and (row_text[0] in _TRIM_CHARS or row_text[-1] in _TRIM_CHARS):
+                row_text = row_text.strip(_TRIM_CHARS)
 
             chosen_index_str = f"Current Row Index: {chosen_index}"
 
-            print(f"[DEBUG] Mode: {loop_mode}, Chosen Index: {chosen_index}")
-            print(f"[DEBUG] Raw Row Text: {repr(row_text)}")
+            if _DEBUG:
+                print(f"[DEBUG] Mode: {loop_mode}, Chosen Index: {chosen_index}")
+                print(f"[DEBUG] Raw Row Text: {repr(row_text)}")
 
             return (row_text, chosen_index_str)
 
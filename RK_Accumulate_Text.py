@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 
 class RK_Accumulate_Text_Multiline:
-    # Class variable to store accumulated text
-    accumulated_text = ""
+    # Class variables to store accumulated text as chunks, joined only when it changed
+    accumulated_chunks = []
+    append_version = 0
+    joined_version = 0
+    joined_text = ""
 
     @classmethod
     def INPUT_TYPES(cls):
@@ -29,11 +32,19 @@ class RK_Accumulate_Text_Multiline:
     FUNCTION = "accumulate_text"
     CATEGORY = "RK_tools_v02"
 
+    def get_accumulated_text(self):
+        # Re-join only if chunks were appended or reset since the last join
+        if self.__class__.joined_version != self.__class__.append_version:
+            self.__class__.joined_text = "".join(self.__class__.accumulated_chunks)
+            self.__class__.joined_version = self.__class__.append_version
+        return self.__class__.joined_text
+
     def accumulate_text(self, input_text_1, input_text_2, separator, reset_accumulation):
         try:
             # Reset if requested
             if reset_accumulation == "yes":
-                self.__class__.accumulated_text = ""
+                self.__class__.accumulated_chunks = []
+                self.__class__.append_version += 1
 
             # Combine inputs into a new block of text
             if input_text_1.strip() and input_text_2.strip():
@@ -43,16 +54,16 @@ class RK_Accumulate_Text_Multiline:
             else:
                 new_block = input_text_2
 
-            # If there is already accumulated text and new_block is not empty
-            if self.__class__.accumulated_text.strip() and new_block.strip():
-                self.__class__.accumulated_text += separator + new_block
-            else:
-                # If accumulated text is empty, just set it to the new block
-                # Or if the new block is empty, do nothing
-                if new_block.strip():
-                    self.__class__.accumulated_text += new_block
+            # If the new block is empty, do nothing
+            if new_block.strip():
+                # If there is already accumulated text, add the separator first
+                if self.__class__.accumulated_chunks:
+                    self.__class__.accumulated_chunks.append(separator + new_block)
+                else:
+                    self.__class__.accumulated_chunks.append(new_block)
+                self.__class__.append_version += 1
 
-            return (self.__class__.accumulated_text,)
+            return (self.get_accumulated_text(),)
 
         except Exception as e:
             print(f"Error in RK_Accumulate_Text_Multiline: {str(e)}")
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 
 class RK_Accumulate_Text_Multiline_Numbered:
-    # Class variables to store accumulated text and line count
-    accumulated_text = ""
+    # Class variables to store accumulated text (as chunks, joined only when it changed) and line count
+    accumulated_chunks = []
+    append_version = 0
+    joined_version = 0
+    joined_text = ""
     line_count = 1
 
     @classmethod
@@ -31,11 +34,19 @@ class RK_Accumulate_Text_Multiline_Numbered:
     FUNCTION = "accumulate_text"
     CATEGORY = "RK_tools_v02"
 
+    def get_accumulated_text(self):
+        # Re-join only if chunks were appended or reset since the last join
+        if self.__class__.joined_version != self.__class__.append_version:
+            self.__class__.joined_text = "".join(self.__class__.accumulated_chunks)
+            self.__class__.joined_version = self.__class__.append_version
+        return self.__class__.joined_text
+
     def accumulate_text(self, input_text_1, input_text_2, separator, reset_accumulation, line_numbering):
         try:
             # Reset if requested
             if reset_accumulation == "yes":
-                self.__class__.accumulated_text = ""
+                self.__class__.accumulated_chunks = []
+                self.__class__.append_version += 1
                 self.__class__.line_count = 1
 
             # Combine inputs into a new block of text
@@ -48,43 +59,45 @@ class RK_Accumulate_Text_Multiline_Numbered:
 
             # If no new text, just return current state
             if not new_block.strip():
-                return (self.__class__.accumulated_text,)
-
-            # Split the new block into lines
-            new_lines = new_block.split("\n")
+                return (self.get_accumulated_text(),)
 
             # Prepare the block with or without numbering
-            formatted_block = []
             if line_numbering == "yes":
-                # Add line numbers to each line
-                for line in new_lines:
-                    if line.strip():
-                        formatted_block.append(f"{self.__class__.line_count}. {line}")
-                        self.__class__.line_count += 1
+                formatted_block = []
+
+                # Add line numbers to each line (splitlines also handles \r\n line endings)
+                line_count = self.__class__.line_count
+                for line in new_block.splitlines():
+                    # isspace() tests for blank lines without allocating a stripped copy
+                    if line and not line.isspace():
+                        formatted_block.append(f"{line_count}. {line}")
+                        line_count += 1
                     else:
                         # Even if line is empty, we might still increment line_count if desired.
                         # For simplicity, let's not increment on empty lines, so numbering only increments on actual text lines.
                         formatted_block.append(line)
-            else:
-                # No numbering, just use lines as-is
-                formatted_block = new_lines
+                self.__class__.line_count = line_count
 
-            # Join the formatted lines back into a single block
-            new_block_formatted = "\n".join(formatted_block)
+                # Keep a trailing line break, which splitlines() drops
+                if new_block.endswith(("\n", "\r")):
+                    formatted_block.append("")
+
+                # Join the formatted lines back into a single block
+                new_block_formatted = "\n".join(formatted_block)
+            else:
+                # No numbering, just use the block as-is
+                new_block_formatted = new_block
 
             # Append to the accumulated text
             # If there's already accumulated text, add the separator
-            if self.__class__.accumulated_text.strip() and new_block_formatted.strip():
-                self.__class__.accumulated_text += separator + new_block_formatted
+            if self.__class__.accumulated_chunks:
+                self.__class__.accumulated_chunks.append(separator + new_block_formatted)
             else:
-                # If there's no accumulated text yet or new_block_formatted is the first significant addition
-                if not self.__class__.accumulated_text.strip():
-                    self.__class__.accumulated_text = new_block_formatted
-                else:
-                    # accumulated text is empty or no new meaningful text
-                    self.__class__.accumulated_text += new_block_formatted
-
-            return (self.__class__.accumulated_text,)
+                # new_block_formatted is the first significant addition
+                self.__class__.accumulated_chunks.append(new_block_formatted)
+            self.__class__.append_version += 1
+
+            return (self.get_accumulated_text(),)
 
         except Exception as e:
             print(f"Error in RK_Accumulate_Text_Multiline_Numbered: {str(e)}")
@@ -3,16 +3,17 @@ import sys
 import json
 import inspect
 import logging
+import operator
 import traceback
-import numpy as np
-import torch
-from PIL import Image
+
+# Sorted NODE_CLASS_MAPPINGS keys for INPUT_TYPES, rebuilt only when the node count changes
+_node_names_cache = {"len": -1, "names": []}
 
 class RK_Advanced_Script_Finder:
     def __init__(self):
-        self.node_list = []
-        self.custom_node_list = []
-        self.update_node_list()
+        # Filled by update_node_list() when the user asks for a refresh
+        self.node_list = None
+        self.custom_node_list = None
 
     def update_node_list(self):
         """Scan and update the list of available nodes in ComfyUI"""
@@ -44,8 +45,9 @@ class RK_Advanced_Script_Finder:
                     continue
             
             # Sort nodes alphabetically
-            self.node_list.sort(key=lambda x: x['name'])
-            self.custom_node_list.sort(key=lambda x: x['name'])
+            by_name = operator.itemgetter('name')
+            self.node_list.sort(key=by_name)
+            self.custom_node_list.sort(key=by_name)
             
         except Exception as e:
             logging.error(f"Error updating node list: {str(e)}")
@@ -55,7 +57,10 @@ class RK_Advanced_Script_Finder:
     def INPUT_TYPES(cls):
         try:
             import nodes
-            node_names = sorted(list(nodes.NODE_CLASS_MAPPINGS.keys()))
+            if _node_names_cache["len"] != len(nodes.NODE_CLASS_MAPPINGS):
+                _node_names_cache["names"] = sorted(nodes.NODE_CLASS_MAPPINGS)
+                _node_names_cache["len"] = len(nodes.NODE_CLASS_MAPPINGS)
+            node_names = _node_names_cache["names"]
             if not node_names:
                 node_names = ["No nodes found"]
                 
@@ -101,67 +106,84 @@ class RK_Advanced_Script_Finder:
     FUNCTION = "find_script"
     CATEGORY = "RK/utils"
 
+    # (file_path, class source) per node class, filled the first time a node is viewed
+    _source_cache = {}
+
+    def scan_class_source(self, node_name, node_class):
+        """Fallback when inspect can't get the source: find the class body by indentation"""
+        # Get the module
+        module = inspect.getmodule(node_class)
+        if not module:
+            raise ValueError(f"Could not find module for {node_name}")
+
+        # Get file path
+        try:
+            file_path = inspect.getfile(module)
+        except TypeError:
+            raise ValueError(f"Could not determine file path for {node_name}")
+
+        # Read entire file content
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                file_content = f.read()
+        except Exception as e:
+            raise ValueError(f"Error reading file: {str(e)}")
+
+        # Find the class definition
+        class_def = f"class {node_class.__name__}:"
+        class_start = file_content.find(class_def)
+
+        if class_start == -1:
+            raise ValueError(f"Could not find class definition for {node_name}")
+
+        # Extract class source code
+        lines = file_content[class_start:].split('\n')
+        class_lines = []
+        indent_level = None
+
+        for line in lines:
+            # Determine initial indent level
+            if indent_level is None:
+                if line.strip().startswith('class'):
+                    indent_level = len(line) - len(line.lstrip())
+                continue
+
+            # Check if we've reached the end of the class
+            current_indent = len(line) - len(line.lstrip())
+            if current_indent <= indent_level and line.strip():
+                break
+
+            class_lines.append(line)
+
+        return file_path, "\n".join(class_lines)
+
     def get_node_source_code(self, node_name):
         """Get the source code of a node"""
         try:
             import nodes
-            import inspect
-            import os
 
             # Get the node class
             node_class = nodes.NODE_CLASS_MAPPINGS.get(node_name)
             if not node_class:
                 return f"Node '{node_name}' not found"
 
-            # Get the module
-            module = inspect.getmodule(node_class)
-            if not module:
-                return f"Could not find module for {node_name}"
-
-            # Get file path
-            try:
-                file_path = inspect.getfile(module)
-            except TypeError:
-                return f"Could not determine file path for {node_name}"
-
-            # Read entire file content
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-            except Exception as e:
-                return f"Error reading file: {str(e)}"
-
-            # Find the class definition
-            class_def = f"class {node_class.__name__}:"
-            class_start = file_content.find(class_def)
-            
-            if class_start == -1:
-                return f"Could not find class definition for {node_name}"
-
-            # Extract class source code
-            lines = file_content[class_start:].split('\n')
-            class_lines = []
-            indent_level = None
-
-            for line in lines:
-                # Determine initial indent level
-                if indent_level is None:
-                    if line.strip().startswith('class'):
-                        indent_level = len(line) - len(line.lstrip())
-                    continue
-
-                # Check if we've reached the end of the class
-                current_indent = len(line) - len(line.lstrip())
-                if current_indent <= indent_level and line.strip():
-                    break
-
-                class_lines.append(line)
+            cached = RK_Advanced_Script_Finder._source_cache.get(node_class)
+            if cached is None:
+                try:
+                    cached = (inspect.getfile(node_class), inspect.getsource(node_class))
+                except (OSError, TypeError):
+                    try:
+                        cached = self.scan_class_source(node_name, node_class)
+                    except ValueError as e:
+                        return str(e)
+                RK_Advanced_Script_Finder._source_cache[node_class] = cached
+            file_path, class_source = cached
 
             # Construct formatted output
             source_output = f"=== Node: {node_name} ===\n"
             source_output += f"File: {file_path}\n\n"
             source_output += "=== Source Code ===\n"
-            source_output += "\n".join(class_lines)
+            source_output += class_source
 
             return source_output
 
@@ -174,6 +196,7 @@ class RK_Advanced_Script_Finder:
             # Refresh node list if requested
             if refresh_list:
                 self.update_node_list()
+                RK_Advanced_Script_Finder._source_cache.clear()
 
             # Handle source code view mode
             if view_mode == "View Source Code":
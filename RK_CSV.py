@@ -2,6 +2,24 @@ import os
 import sys
 import random
 import csv
+import functools
+
+# Set RK_DEBUG=1 to print the chosen row on every run
+_DEBUG = os.environ.get("RK_DEBUG") == "1"
+
+# Spaces plus standard and fancy quotes, stripped from both ends of a row
+_TRIM_CHARS = ' "“”'
+
+@functools.lru_cache(maxsize=8)
+def _load_csv(file_path, delimiter, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key, so a rewritten file is parsed again
+    with open(file_path, "r", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        data = list(reader)
+
+    # Rows are re-joined with the same delimiter they were split on, so join them once here
+    joined = [delimiter.join(map(str, row)) for row in data]
+    return data, joined
 
 class RK_Excel_File_State_Looper:
     @classmethod
@@ -44,58 +62,95 @@ class RK_Excel_File_State_Looper:
     FUNCTION = "read_row"
     CATEGORY = "RK_tools_v02"
 
-    # Cache variables
-    file_data_cache = None
-    file_path_cache = None
+    # Shuffled index order per (start_index, end_index) for random mode: {key: [perm, position]}
+    _perm_cache = {}
+
+    # State file path per (file_path, start_index, end_index, step_size, loop_mode)
+    _state_path_cache = {}
+
+    # Increment-mode index per state file, with the file's (mtime_ns, size) when it was
+    # last read or written: {state_file: (index, mtime_ns, size)}. The file is read again
+    # only when it changed on disk, so editing or deleting it still resets the loop
+    _index_state = {}
 
     def load_file(self, file_path, delimiter):
         """
-        Loads a CSV file into a list of lists and caches it.
+        Loads a CSV file into rows (a list of lists)
+        plus each row joined back into text, cached per file version and delimiter.
         """
-        if RK_Excel_File_State_Looper.file_path_cache != file_path:
-            if not os.path.isfile(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            _, ext = os.path.splitext(file_path)
-            ext = ext.lower()
+        _, ext = os.path.splitext(file_path)
+        ext = ext.lower()
 
-            if ext != ".csv":
-                raise ValueError(f"Unsupported file extension: {ext}. Only .csv is supported.")
+        if ext != ".csv":
+            raise ValueError(f"Unsupported file extension: {ext}. Only .csv is supported.")
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=delimiter)
-                data = list(reader)
-
-            RK_Excel_File_State_Looper.file_data_cache = data
-            RK_Excel_File_State_Looper.file_path_cache = file_path
-
-        return RK_Excel_File_State_Looper.file_data_cache
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return _load_csv(file_path, delimiter, st.st_mtime_ns, st.st_size)
 
     def get_row_count(self, data):
         return len(data)
 
+    def next_random_index(self, start_index, end_index):
+        # Walk a shuffled permutation of the range so every row comes up once before any repeats
+        key = (start_index, end_index)
+        state = RK_Excel_File_State_Looper._perm_cache.get(key)
+        if state is None:
+            perm = list(range(start_index, end_index + 1))
+            random.shuffle(perm)
+            state = [perm, 0]
+            RK_Excel_File_State_Looper._perm_cache[key] = state
+
+        perm, pos = state
+        chosen_index = perm[pos]
+        pos += 1
+        if pos >= len(perm):
+            # Full pass done, reshuffle for the next one
+            random.shuffle(perm)
+            pos = 0
+        state[1] = pos
+        return chosen_index
+
     def get_state_file_path(self, file_path, start_index, end_index, step_size, loop_mode):
-        base, ext = os.path.splitext(file_path)
-        state_file = f"{base}_state_{loop_mode}_{start_index}_{end_index}_{step_size}.txt"
+        key = (file_path, start_index, end_index, step_size, loop_mode)
+        state_file = RK_Excel_File_State_Looper._state_path_cache.get(key)
+        if state_file is None:
+            base, ext = os.path.splitext(file_path)
+            state_file = f"{base}_state_{loop_mode}_{start_index}_{end_index}_{step_size}.txt"
+            RK_Excel_File_State_Looper._state_path_cache[key] = state_file
         return state_file
 
     def read_current_index(self, state_file, start_index):
-        if os.path.isfile(state_file):
-            try:
-                with open(state_file, 'r', encoding='utf-8') as f:
-                    val = f.read().strip()
-                    return int(val)
-            except:
-                pass
-        return start_index
+        try:
+            st = os.stat(state_file)
+        except OSError:
+            # No saved position yet (or deleted to reset the loop): start from the beginning
+            return start_index
+        cached = RK_Excel_File_State_Looper._index_state.get(state_file)
+        if cached is not None and cached[1] == st.st_mtime_ns and cached[2] == st.st_size:
+            return cached[0]
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                index = int(f.read().strip())
+        except (OSError, ValueError):
+            # Unreadable: start from the beginning
+            return start_index
+        RK_Excel_File_State_Looper._index_state[state_file] = (index, st.st_mtime_ns, st.st_size)
+        return index
 
     def write_current_index(self, state_file, index):
+        # Written on every update, so a crash never loses the position
         with open(state_file, 'w', encoding='utf-8') as f:
             f.write(str(index))
+            f.flush()
+            st = os.fstat(f.fileno())
+        RK_Excel_File_State_Looper._index_state[state_file] = (index, st.st_mtime_ns, st.st_size)
 
     def read_row(self, file_path, loop_mode, start_index, end_index, step_size, delimiter):
         try:
-            data = self.load_file(file_path, delimiter)
+            data, joined = self.load_file(file_path, delimiter)
             total_rows = self.get_row_count(data)
 
             # Adjust indices if out of range
@@ -114,7 +169,7 @@ class RK_Excel_File_State_Looper:
                 chosen_index = start_index
 
             elif loop_mode == "random":
-                chosen_index = random.randint(start_index, end_index)
+                chosen_index = self.next_random_index(start_index, end_index)
 
             elif loop_mode == "increment":
                 current_index = self.read_current_index(state_file, start_index)
@@ -127,15 +182,16 @@ class RK_Excel_File_State_Looper:
             else:
                 chosen_index = start_index
 
-            row_data = data[chosen_index]
-            # Join row data with the chosen delimiter (for display)
-            row_text = delimiter.join(map(str, row_data))
+            # Row data joined with the chosen delimiter (for display)
+            row_text = joined[chosen_index]
 
-            # Remove leading/trailing quotes (standard and fancy quotes)
-            row_text = row_text.strip(' "“”')
+            # Remove leading/trailing quotes (standard and fancy quotes), only if either end has one
+            if row_text and (row_text[0] in _TRIM_CHARS or row_text[-1] in _TRIM_CHARS):
+                row_text = row_text.strip(_TRIM_CHARS)
 
-            print(f"[DEBUG] Mode: {loop_mode}, Chosen Index: {chosen_index}")
-            print(f"[DEBUG] Raw Row Text: {repr(row_text)}")
+            if _DEBUG:
+                print(f"[DEBUG] Mode: {loop_mode}, Chosen Index: {chosen_index}")
+                print(f"[DEBUG] Raw Row Text: {repr(row_text)}")
 
             # Return only the row_text
             return (row_text,)
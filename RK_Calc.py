@@ -1,5 +1,14 @@
+import operator
 from typing import Any
 
+# Supported operators (calculate's "operator" argument shadows the module inside the method)
+_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
 class RK_Calc:
     @classmethod
     def INPUT_TYPES(cls):
@@ -22,18 +31,13 @@ class RK_Calc:
 
     def calculate(self, number1: float, operator: str, number2: float) -> Any:
         try:
-            if operator == '+':
-                result_float = number1 + number2
-            elif operator == '-':
-                result_float = number1 - number2
-            elif operator == '*':
-                result_float = number1 * number2
-            elif operator == '/':
-                if number2 == 0:
-                    raise ValueError("Division by zero is not allowed.")
-                result_float = number1 / number2
-            else:
+            op = _OPS.get(operator)
+            if op is None:
                 raise ValueError(f"Unsupported operator: {operator}")
+            try:
+                result_float = op(number1, number2)
+            except ZeroDivisionError:
+                raise ValueError("Division by zero is not allowed.")
         except Exception as e:
             raise ValueError(f"Error in calculation: {e}")
 
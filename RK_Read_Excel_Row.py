@@ -1,8 +1,19 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
+import datetime
+import openpyxl
 import pandas as pd
 
+# Prefer the Rust-backed calamine reader when it is installed (pip install python-calamine)
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Formats openpyxl can stream row by row in read-only mode
+OPENPYXL_EXTENSIONS = (".xlsx", ".xlsm", ".xltx", ".xltm")
+
 class RK_Read_Excel_Row:
     @classmethod
     def INPUT_TYPES(cls):
@@ -29,27 +40,87 @@ class RK_Read_Excel_Row:
     FUNCTION = "read_excel_row"
     CATEGORY = "RK_tools_v02"
 
+    def format_cell(self, value):
+        # Empty cells come back as None from openpyxl, "" from calamine and NaN from pandas;
+        # all of them print as "nan", the way the node always showed them
+        if value is None or value is pd.NaT or (isinstance(value, str) and not value) or (isinstance(value, float) and value != value):
+            return "nan"
+        # calamine reports every number as float; show whole numbers without ".0" on every path
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        # calamine gives date-only cells as date; openpyxl and pandas give them as midnight datetime
+        if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+            return datetime.datetime.combine(value, datetime.time())
+        return value
+
+    def read_xlsx_row(self, file_path, row_index):
+        """
+        Streams the first sheet in read-only mode and stops at row_index.
+        Returns None if the sheet has fewer rows.
+        """
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+            rows = sheet.iter_rows(min_row=row_index + 1, max_row=row_index + 1, values_only=True)
+            return next(rows, None)
+        finally:
+            workbook.close()
+
+    def read_sheet_row(self, file_path, row_index):
+        """
+        Reads the first sheet (.xls and other formats) up to row_index and returns that row.
+        Returns None if the sheet has fewer rows.
+        """
+        if CalamineWorkbook is not None:
+            # Read the sheet as plain Python rows, skipping the DataFrame entirely
+            sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0)
+            rows = sheet.to_python(skip_empty_area=False, nrows=row_index + 1)
+            if row_index >= len(rows):
+                return None
+            return rows[row_index]
+
+        # Read the Excel file using pandas, asking for just the one row
+        try:
+            rows = pd.read_excel(file_path, header=None, skiprows=row_index, nrows=1).values  # No header, treat all rows as data
+            return rows[0] if len(rows) else None
+        except (TypeError, ValueError):
+            # Engine rejected skiprows/nrows: read everything
+            rows = pd.read_excel(file_path, header=None).values
+            if row_index >= len(rows):
+                return None
+            return rows[row_index]
+
     def read_excel_row(self, file_path, row_index, delimiter):
         try:
-            # Check if file exists
-            if not os.path.isfile(file_path):
-                raise FileNotFoundError(f"Excel file not found: {file_path}")
+            if row_index < 0:
+                raise IndexError(f"Row index {row_index} is out of range.")
+
+            # Only read as far as the requested row when the format allows it
+            if file_path.lower().endswith(OPENPYXL_EXTENSIONS):
+                row = self.read_xlsx_row(file_path, row_index)
+            else:
+                row = self.read_sheet_row(file_path, row_index)
 
-            # Read the Excel file using pandas
-            df = pd.read_excel(file_path, header=None)  # No header, treat all rows as data
-            
             # Check if row_index is within range
-            if row_index < 0 or row_index >= len(df):
-                raise IndexError(f"Row index {row_index} is out of range. File has {len(df)} rows.")
+            if row is None:
+                raise IndexError(f"Row index {row_index} is out of range.")
 
             # Extract the row data
-            row_data = df.iloc[row_index].tolist()
+            row_data = [self.format_cell(value) for value in row]
 
             # Convert all values to strings and join them
             row_text = delimiter.join(map(str, row_data))
 
             return (row_text,)
 
+        except OSError as e:
+            # Only check whether the file exists once opening it has failed
+            if not os.path.exists(file_path):
+                print(f"Error in RK_Read_Excel_Row: Excel file not found: {file_path}")
+            else:
+                print(f"Error in RK_Read_Excel_Row: {str(e)}")
+            return ("",)
+
         except Exception as e:
             print(f"Error in RK_Read_Excel_Row: {str(e)}")
             return ("",)
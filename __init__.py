@@ -1,6 +1,5 @@
 import os
 import sys
-import pkgutil
 import importlib
 
 # Initialize the mappings
@@ -15,14 +14,24 @@ package_name = os.path.basename(package_path)
 if package_path not in sys.path:
     sys.path.append(package_path)
 
-# Iterate over all modules in the current package
-for module_info in pkgutil.iter_modules([package_path]):
-    module_name = module_info.name
-
-    # Skip __init__ module and any non-Python files
-    if module_name == '__init__':
-        continue
-
+# Node modules shipped with the package, in registration order
+# (later modules win when two register the same node name).
+# prompt_gen1 / prompt_gen_v03 (and their ollama_api helper) are standalone Tk apps and requirement is an install note, so they are not loaded.
+_MODULES = [
+    "RK Excel Row Loope",
+    "RK_Accumulate_Text",
+    "RK_Accumulate_Text_Multiline_Numbered",
+    "RK_Advanced_Script_Finder",
+    "RK_CSV",
+    "RK_Calc",
+    "RK_Read_Excel_Row",
+    "concatenate_text",
+    "rk_Write_Text",
+    "rk_save_image",
+    "rk_seed",
+]
+
+for module_name in _MODULES:
     try:
         # Import the module
         module = importlib.import_module(f'.{module_name}', package_name)
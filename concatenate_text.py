@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-import os
+# Characters read per chunk when loading a file
+READ_CHUNK_SIZE = 8 * 1024 * 1024
 
 class RK_Concatenate_Text:
     @classmethod
@@ -40,39 +41,48 @@ class RK_Concatenate_Text:
 
     def concatenate_text(self, input_text_1, input_text_2, concatenation_mode, prefix, suffix, load_from_file, file_path):
         try:
-            # Optionally load text from file
-            file_text = ""
+            # Optionally load text from file, in chunks that go straight into the
+            # final join (no whole-file read buffer, no separate file_text copy)
+            file_chunks = []
             if load_from_file == "yes" and file_path.strip():
-                if os.path.exists(file_path) and os.path.isfile(file_path):
-                    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        file_text = f.read()
-                else:
+                # Just try to open it: a missing path or a folder fails here,
+                # without separate exists()/isfile() checks first
+                try:
+                    f = open(file_path, 'r', encoding='utf-8', errors='replace')
+                except OSError:
                     print(f"Warning: The file path '{file_path}' does not exist or is not a file.")
+                else:
+                    with f:
+                        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), ""):
+                            file_chunks.append(chunk)
+
+            # Collect the pieces in order and join once at the end
+            parts = [prefix]
 
             # Determine the concatenation approach
-            if concatenation_mode == "append":
-                # input_text_1 + input_text_2 + file_text
-                combined_text = input_text_1 + input_text_2 + file_text
-            elif concatenation_mode == "prepend":
+            if concatenation_mode == "prepend":
                 # file_text + input_text_1 + input_text_2
-                combined_text = file_text + input_text_1 + input_text_2
-            elif concatenation_mode == "join_with_space":
-                # Join non-empty texts with a space
-                segments = [t for t in [input_text_1, input_text_2, file_text] if t.strip()]
-                combined_text = " ".join(segments)
-            elif concatenation_mode == "join_with_newline":
-                # Join non-empty texts with a newline
-                segments = [t for t in [input_text_1, input_text_2, file_text] if t.strip()]
-                combined_text = "\n".join(segments)
+                parts += file_chunks
+                parts += [input_text_1, input_text_2]
+            elif concatenation_mode in ("join_with_space", "join_with_newline"):
+                # Join non-empty texts with a space or a newline
+                sep = " " if concatenation_mode == "join_with_space" else "\n"
+                segments = [[t] for t in [input_text_1, input_text_2] if t.strip()]
+                if any(not chunk.isspace() for chunk in file_chunks):
+                    segments.append(file_chunks)
+                for i, segment in enumerate(segments):
+                    if i:
+                        parts.append(sep)
+                    parts += segment
             else:
-                # Default to just appending if somehow invalid mode is chosen
-                combined_text = input_text_1 + input_text_2 + file_text
+                # "append" (and the default if somehow invalid mode is chosen):
+                # input_text_1 + input_text_2 + file_text
+                parts += [input_text_1, input_text_2]
+                parts += file_chunks
 
-            # Add prefix and suffix
-            if prefix:
-                combined_text = prefix + combined_text
-            if suffix:
-                combined_text = combined_text + suffix
+            # Add suffix (prefix is already first)
+            parts.append(suffix)
+            combined_text = "".join(parts)
 
             return input_text_1, input_text_2, combined_text
 
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import http.client
+from urllib.parse import urlsplit
+
+# Port the Ollama server listens on unless OLLAMA_HOST names another one
+DEFAULT_OLLAMA_PORT = 11434
+# An explicit scheme without a port means that scheme's standard port, as in the ollama CLI
+SCHEME_PORTS = {"http": 80, "https": 443}
+
+def ollama_address(host: str = None):
+    """
+    Turn an OLLAMA_HOST value into (scheme, hostname, port, path), the way the
+    ollama CLI accepts it: "127.0.0.1:11434", "0.0.0.0", "myserver",
+    "http://myserver:11434", "https://example.com/ollama", "[::1]:11434" ...
+    Without a scheme the port defaults to 11434; "http://" and "https://"
+    default to 80 and 443. Empty means 127.0.0.1:11434. path is the URL
+    prefix the API sits under ("" for none). A listen-on-all-interfaces
+    address (0.0.0.0 / ::) is reached through loopback.
+    """
+    if host is None:
+        host = os.environ.get("OLLAMA_HOST", "")
+    host = host.strip()
+    given_scheme, _, hostport = host.rpartition("://")
+    given_scheme = given_scheme.lower()
+    hostport, slash, path = hostport.partition("/")
+    if hostport.count(":") > 1 and not hostport.startswith("["):
+        # Bare IPv6 address such as "::" or "::1", no port
+        hostport = f"[{hostport}]"
+    parts = urlsplit(f"http://{hostport}")
+    scheme = "https" if given_scheme == "https" else "http"
+    hostname = parts.hostname or "127.0.0.1"
+    if hostname == "0.0.0.0":
+        hostname = "127.0.0.1"
+    elif hostname == "::":
+        hostname = "::1"
+    port = parts.port or SCHEME_PORTS.get(given_scheme, DEFAULT_OLLAMA_PORT)
+    path = (slash + path).rstrip("/")
+    return scheme, hostname, port, path
+
+def ollama_connection(timeout: float = 600):
+    """
+    New (not yet connected) HTTP connection to the Ollama server from OLLAMA_HOST.
+    """
+    scheme, hostname, port, _ = ollama_address()
+    if scheme == "https":
+        return http.client.HTTPSConnection(hostname, port, timeout=timeout)
+    return http.client.HTTPConnection(hostname, port, timeout=timeout)
+
+def ollama_endpoint(endpoint: str):
+    """
+    Request path for an API endpoint such as "/api/generate", under the
+    path prefix OLLAMA_HOST gives (e.g. a server behind a reverse proxy).
+    """
+    return ollama_address()[3] + endpoint
+
+def ollama_http_error(status: int, data: bytes, model_name: str):
+    """
+    RuntimeError with a readable message for a non-200 answer from /api/generate.
+    `ollama run` pulled missing models by itself; the HTTP API answers 404 instead.
+    """
+    try:
+        detail = json.loads(data).get("error", "")
+    except (ValueError, AttributeError):
+        detail = data.decode("utf-8", "replace").strip()
+    if status == 404:
+        return RuntimeError(
+            f"model '{model_name}' not found on the Ollama server; "
+            f"run `ollama pull {model_name}` and try again"
+        )
+    return RuntimeError(f"Ollama returned HTTP {status}: {detail}")
@@ -1,11 +1,21 @@
 import os
-import re
 import csv
-import subprocess
+import functools
+import json
+import hashlib
+import queue
+import re
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import http.client
 import tkinter as tk
 from tkinter import ttk, filedialog
 
+# Shared with prompt_gen_v03: OLLAMA_HOST parsing and readable API errors
+from ollama_api import ollama_connection, ollama_endpoint, ollama_http_error
+
 # ======================================
 # GLOBALS
 # ======================================
@@ -14,9 +24,115 @@ stop_generation = False
 # Dictionary of memory per model: { model_name: [ {title, desc, style}, ... ] }
 ALL_PROMPTS_MEMORY = {}
 
+# Same prompts as 16-byte digests (see prompt_key) for O(1) duplicate checks: { model_name: set() }
+ALL_PROMPTS_SEEN = {}
+
+# Last MEMORY_PROMPT_WINDOW memory entries rendered as prompt lines, extended only when new prompts arrive:
+# { model_name: [rendered_count, deque([line, ...])] }
+ALL_PROMPTS_MEMORY_RENDERED = {}
+
+# Held while a rendered entry is checked and extended: workers for the same model
+# run side by side and would otherwise both render the same new entries
+MEMORY_RENDER_LOCK = threading.Lock()
+
+# Only the most recent memory entries are shown to the model (duplicates are still checked against all of them)
+MEMORY_PROMPT_WINDOW = 30
+
+# Sampling options for the attempt after a duplicate, to push the model away from repeating itself
+DUPLICATE_RETRY_OPTIONS = {"temperature": 1.1, "top_p": 0.95}
+
+# Prompts requested per Ollama call; the prompt prefill is paid once per batch
+PROMPTS_PER_CALL = 8
+
+# Worker threads put log text here; the Tk main loop drains it into the log box
+log_queue = queue.Queue()
+
+# Latest percentage per progress bar posted by workers; applied by the Tk main loop: { progress_bar: value }
+progress_updates = {}
+
+# Minimum seconds between progress posts from one worker
+PROGRESS_INTERVAL = 0.25
+
+# Oldest lines are dropped from the log box beyond this many
+LOG_MAX_LINES = 5000
+
+# Fixed system prompt returned by build_basic_system_prompt
+_BASIC_SYSTEM_PROMPT = """SYSTEM:
+You are an AI specialized in creating random, photorealistic prompts.
+Always produce unique results.
+
+Use this structure:
+Title: (up to 5 words)
+Description: (up to 20 words, photorealistic)
+Style: (1-3 words, e.g. cinematic, macro, surreal)
+"""
+
+# Line prefixes parse_ollama_output looks for (compared lower-cased) and the field each fills
+_FIELD_PREFIXES = (
+    ("title:", "title"),
+    ("description:", "description"),
+    ("style:", "style"),
+)
+
+# List markers models put in front of batch answers: "1.", "2)", "-", "*", "•"
+_LIST_MARKER = re.compile(r"(?:\d+[.)]|[-*•])\s+")
+
 # ======================================
 # HELPER FUNCTIONS
 # ======================================
+def _strip_list_marker(line: str):
+    """
+    The line without surrounding spaces, a leading list marker or markdown
+    bold, so "1. **Title:** Foo" and "- Title: Foo" read as "Title: Foo".
+    """
+    stripped = line.strip()
+    marker = _LIST_MARKER.match(stripped)
+    if marker:
+        stripped = stripped[marker.end():]
+    if "**" in stripped:
+        stripped = stripped.replace("**", "").strip()
+    return stripped
+
+@functools.lru_cache(maxsize=1024)
+def _parse_fields(response: str):
+    """
+    Cached core of parse_ollama_output: returns (title, description, style)
+    or None. A model stuck repeating itself sends the same text again, and
+    that is then a dict lookup instead of another parse.
+    """
+    # Responses are a few short lines, so plain prefix checks beat a regex scan.
+    # Keep the first non-empty value of each field.
+    fields = {}
+    for line in response.splitlines():
+        stripped = _strip_list_marker(line)
+        head = stripped[:12].lower()
+        for prefix, name in _FIELD_PREFIXES:
+            if head.startswith(prefix):
+                if name not in fields:
+                    value = stripped[len(prefix):].strip()
+                    if name == "title":
+                        # Drop one pair of optional quotes around the title
+                        if value[:1] in ('"', '“'):
+                            value = value[1:]
+                        if value[-1:] in ('"', '”'):
+                            value = value[:-1]
+                        value = value.strip()
+                    if value:
+                        fields[name] = value
+                break
+        if len(fields) == 3:
+            break
+
+    title = fields.get("title", "")
+    desc  = fields.get("description", "")
+    style = fields.get("style", "")
+
+    # If all are empty, treat as unparsed
+    if not title and not desc and not style:
+        return None
+
+    return title, desc, style
+
 def parse_ollama_output(response: str):
     """
     Attempt to parse the Ollama response to extract Title, Description, and Style.
@@ -27,27 +143,109 @@ def parse_ollama_output(response: str):
     Also handle optional quotes, indentation, etc.
     Return None if nothing is matched.
     """
-    title_match = re.search(r'(?im)^\s*Title:\s*["“]?(.+?)["”]?\s*$', response)
-    desc_match  = re.search(r'(?im)^\s*Description:\s*(.+)$', response)
-    style_match = re.search(r'(?im)^\s*Style:\s*(.+)$', response)
-
-    if not title_match and not desc_match and not style_match:
-        return None
-
-    title = title_match.group(1).strip() if title_match else ""
-    desc  = desc_match.group(1).strip()  if desc_match else ""
-    style = style_match.group(1).strip() if style_match else ""
-
-    # If all are empty, treat as unparsed
-    if not title and not desc and not style:
+    fields = _parse_fields(response)
+    if fields is None:
         return None
 
+    # Fresh dict per call, so callers can't alter the cached result
+    title, desc, style = fields
     return {
         "title": title,
         "description": desc,
         "style": style
     }
 
+def split_ollama_prompts(response: str):
+    """
+    Split a response holding several prompts into one text block per prompt.
+    A block ends at a separator line of dashes ("---"), or where a new
+    Title line starts while the current block already has one. Numbered or
+    bulleted markdown lists are understood too:
+
+    >>> reply = "\\n".join([
+    ...     "1. **Title:** Red Fox",
+    ...     "   **Description:** A fox curled up in fresh snow",
+    ...     "   **Style:** macro",
+    ...     "2. **Title**: Old Pier",
+    ...     "   - Description: Fog rolling over a wooden pier at dawn",
+    ...     "   - Style: cinematic",
+    ... ])
+    >>> [parse_ollama_output(block)["title"] for block in split_ollama_prompts(reply)]
+    ['Red Fox', 'Old Pier']
+    >>> parse_ollama_output(split_ollama_prompts(reply)[1])["style"]
+    'cinematic'
+    """
+    blocks = []
+    current = []
+    has_title = False
+    for line in response.splitlines():
+        stripped = line.strip()
+        if len(stripped) >= 3 and not stripped.strip("-"):
+            if current:
+                blocks.append("\n".join(current))
+            current = []
+            has_title = False
+            continue
+        if _strip_list_marker(stripped)[:6].lower() == "title:":
+            if has_title:
+                blocks.append("\n".join(current))
+                current = []
+            has_title = True
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+def build_user_prompt(reference_text: str, count: int):
+    """
+    User instructions asking for `count` prompts, optionally built around the reference text.
+    """
+    if count == 1:
+        request = "Generate 1 new prompt.\nTitle:\nDescription:\nStyle:"
+        if not reference_text.strip():
+            request = "Generate 1 new random prompt.\nTitle:\nDescription:\nStyle:"
+    else:
+        request = f"Generate {count} new prompts. For each, output:\nTitle:\nDescription:\nStyle:\n---"
+        if not reference_text.strip():
+            request = f"Generate {count} new random prompts. For each, output:\nTitle:\nDescription:\nStyle:\n---"
+    if reference_text.strip():
+        return f"USER:\nIncorporate this reference: '{reference_text}'\n{request}"
+    return f"USER:\n{request}"
+
+def prompt_key(parsed: dict):
+    """
+    Fixed-size key for duplicate checks: a 16-byte blake2b digest of
+    title, description and style, so the seen-sets don't hold a second
+    reference to every full description.
+    """
+    text = f"{parsed['title']}\x00{parsed['description']}\x00{parsed['style']}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+def ollama_generate(conn: http.client.HTTPConnection, model_name: str, prompt: str, options: dict = None):
+    """
+    Send one prompt to the Ollama HTTP API over a kept-alive connection
+    and return the response text. Reconnects once if the server dropped
+    the idle connection. options (e.g. temperature) override the model's defaults.
+    """
+    request = {"model": model_name, "prompt": prompt, "stream": False}
+    if options:
+        request["options"] = options
+    body = json.dumps(request)
+    headers = {"Content-Type": "application/json"}
+    for attempt in range(2):
+        try:
+            conn.request("POST", ollama_endpoint("/api/generate"), body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if attempt:
+                raise
+    if response.status != 200:
+        raise ollama_http_error(response.status, data, model_name)
+    return json.loads(data).get("response", "")
+
 def build_system_prompt_with_memory(model_name: str, basic_prompt: str):
     """
     Build a system prompt that includes the memory from ALL_PROMPTS_MEMORY[model_name].
@@ -57,10 +255,24 @@ def build_system_prompt_with_memory(model_name: str, basic_prompt: str):
     if model_name not in ALL_PROMPTS_MEMORY or not ALL_PROMPTS_MEMORY[model_name]:
         return basic_prompt
 
-    memory_text = "\n".join(
-        f"{idx+1}) {p['title']} | {p['description']} | {p['style']}"
-        for idx, p in enumerate(ALL_PROMPTS_MEMORY[model_name])
-    )
+    memory = ALL_PROMPTS_MEMORY[model_name]
+    with MEMORY_RENDER_LOCK:
+        rendered = ALL_PROMPTS_MEMORY_RENDERED.get(model_name)
+        if rendered is None or rendered[0] > len(memory):
+            # First call, or memory shrank under us: render from scratch
+            rendered = ALL_PROMPTS_MEMORY_RENDERED[model_name] = [0, deque(maxlen=MEMORY_PROMPT_WINDOW)]
+        count, lines = rendered
+        # Only render the prompts added since the last call that still fall in the window;
+        # the deque drops the oldest lines. The model sees only the most recent entries,
+        # and a shorter prompt repeats less and runs faster
+        end = len(memory)
+        start = max(count, end - MEMORY_PROMPT_WINDOW)
+        lines.extend(
+            f"{idx+1}) {p['title']} | {p['description']} | {p['style']}"
+            for idx, p in enumerate(memory[start:end], start=start)
+        )
+        rendered[0] = end
+        memory_text = "\n".join(lines)
 
     system_prompt = f"""SYSTEM:
 You are an AI specialized in creating random, photorealistic prompts.
@@ -77,25 +289,41 @@ def build_basic_system_prompt():
     """
     A simpler system prompt if memory is off or no memory exists yet.
     """
-    return """SYSTEM:
-You are an AI specialized in creating random, photorealistic prompts.
-Always produce unique results.
-
-Use this structure:
-Title: (up to 5 words)
-Description: (up to 20 words, photorealistic)
-Style: (1-3 words, e.g. cinematic, macro, surreal)
-"""
+    return _BASIC_SYSTEM_PROMPT
 
-def reset_memory_func(gui_elements):
+def reset_memory_func():
     """
     Clears ALL_PROMPTS_MEMORY for all models and updates the log box.
     """
     global ALL_PROMPTS_MEMORY
     ALL_PROMPTS_MEMORY.clear()
-    log_box = gui_elements["log_box"]
-    log_box.insert(tk.END, "[INFO] All memory has been reset.\n")
-    log_box.see(tk.END)
+    ALL_PROMPTS_SEEN.clear()
+    with MEMORY_RENDER_LOCK:
+        ALL_PROMPTS_MEMORY_RENDERED.clear()
+    log_queue.put("[INFO] All memory has been reset.\n")
+
+def open_prompts_csv(output_csv: str, save_mode: str):
+    """
+    Open output_csv for writing prompts and return (file, csv.writer).
+    Creates missing folders; writes the header unless appending to an existing file.
+    """
+    dirpath = os.path.dirname(output_csv)
+    if dirpath and not os.path.exists(dirpath):
+        os.makedirs(dirpath, exist_ok=True)
+
+    file_mode = "a" if save_mode == "append" else "w"
+
+    # Only write header if overwriting or new file
+    write_header = True
+    if file_mode == "a" and os.path.exists(output_csv):
+        write_header = False
+
+    csvfile = open(output_csv, mode=file_mode, newline="", encoding="utf-8")
+    # Fixed columns, so rows are written as (title, description, style) tuples
+    writer = csv.writer(csvfile)
+    if write_header:
+        writer.writerow(("Title", "Description", "Style"))
+    return csvfile, writer
 
 # ======================================
 # GENERATION LOGIC (for one model)
@@ -107,7 +335,6 @@ def generate_prompts_for_model(
     reference_text: str,
     use_memory: bool,
     save_mode: str,
-    log_box: tk.Text,
     progress_bar: ttk.Progressbar,
 ):
     """
@@ -117,12 +344,14 @@ def generate_prompts_for_model(
     global stop_generation
     global ALL_PROMPTS_MEMORY
 
-    # If the model doesn't have a memory list yet, create one
-    if model_name not in ALL_PROMPTS_MEMORY:
-        ALL_PROMPTS_MEMORY[model_name] = []
+    # If the model doesn't have a memory list yet, create one. setdefault is atomic, so two
+    # workers on the same model can't each install their own list/set and lose the other's entries
+    ALL_PROMPTS_MEMORY.setdefault(model_name, [])
+    ALL_PROMPTS_SEEN.setdefault(model_name, set())
 
-    # We'll store newly generated prompts in a local list for this run
-    new_prompts_this_run = []
+    # Count of prompts generated this run; rows go straight to the CSV
+    generated = 0
+    seen_this_run = set()
     total_prompts = num_prompts
 
     # For duplicates/fallback
@@ -132,132 +361,137 @@ def generate_prompts_for_model(
     # Build a base system prompt
     base_prompt_text = build_basic_system_prompt()
 
-    # Start generation loop
-    while len(new_prompts_this_run) < total_prompts and attempts < max_attempts:
-        if stop_generation:
-            log_box.insert(tk.END, f"\n[INFO] Generation for model '{model_name}' stopped by user.\n")
-            break
-
-        attempts += 1
-
-        # Possibly build memory-based system prompt
-        if use_memory:
-            system_part = build_system_prompt_with_memory(model_name, base_prompt_text)
-        else:
-            system_part = base_prompt_text
-
-        # Build final user instructions
-        if reference_text.strip():
-            user_part = f"USER:\nIncorporate this reference: '{reference_text}'\nGenerate 1 new prompt.\nTitle:\nDescription:\nStyle:"
-        else:
-            user_part = "USER:\nGenerate 1 new random prompt.\nTitle:\nDescription:\nStyle:"
-
-        final_prompt = f"{system_part}\n\n{user_part}\n"
-
-        # Call Ollama via stdin (avoid WinError 206)
-        try:
-            result = subprocess.run(
-                ["ollama", "run", model_name],
-                input=final_prompt,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace"
-            )
-            response_text = result.stdout.strip()
-        except Exception as e:
-            log_box.insert(tk.END, f"[ERROR] Ollama call failed for model '{model_name}': {str(e)}\n")
-            break
-
-        parsed = parse_ollama_output(response_text)
-        if not parsed:
-            # fallback: store entire text as UNPARSED
-            parsed = {
-                "title": "UNPARSED",
-                "description": response_text,
-                "style": ""
-            }
-
-        # Check duplicates if memory is on
-        if use_memory:
-            is_duplicate = any(
-                p["title"] == parsed["title"]
-                and p["description"] == parsed["description"]
-                and p["style"] == parsed["style"]
-                for p in ALL_PROMPTS_MEMORY[model_name]
-            )
-        else:
-            is_duplicate = any(
-                p["title"] == parsed["title"]
-                and p["description"] == parsed["description"]
-                and p["style"] == parsed["style"]
-                for p in new_prompts_this_run
-            )
-
-        if is_duplicate:
-            log_box.insert(tk.END, f"[{model_name}] Attempt {attempts}: Found duplicate, skipping.\n")
-            continue
-
-        # It's new, add it
-        new_prompts_this_run.append(parsed)
-        if use_memory:
-            ALL_PROMPTS_MEMORY[model_name].append(parsed)
-
-        log_box.insert(tk.END,
-            f"[{model_name}] Prompt #{len(new_prompts_this_run)}/{total_prompts}\n"
-            f"Title: {parsed['title']}\n"
-            f"Description: {parsed['description']}\n"
-            f"Style: {parsed['style']}\n\n"
-        )
-        log_box.see(tk.END)
-
-        # Update progress bar (for single-model scenario, or partial for multi-model)
-        # We won't do a perfect 2-model combined progress. We'll just show each model's local progress.
-        progress_value = int((len(new_prompts_this_run) / total_prompts) * 100)
-        progress_bar["value"] = progress_value
-
-    # Write CSV
-    if new_prompts_this_run:
-        try:
-            dirpath = os.path.dirname(output_csv)
-            if dirpath and not os.path.exists(dirpath):
-                os.makedirs(dirpath, exist_ok=True)
-
-            file_mode = "a" if save_mode == "append" else "w"
-
-            # Only write header if overwriting or new file
-            write_header = True
-            if file_mode == "a" and os.path.exists(output_csv):
-                write_header = False
-
-            with open(output_csv, mode=file_mode, newline="", encoding="utf-8") as csvfile:
-                fieldnames = ["Title", "Description", "Style"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                if write_header:
-                    writer.writeheader()
-                for p in new_prompts_this_run:
-                    writer.writerow({
-                        "Title": p["title"],
-                        "Description": p["description"],
-                        "Style": p["style"]
-                    })
-            log_box.insert(
-                tk.END, f"[{model_name}] Saved {len(new_prompts_this_run)} prompts to {output_csv}.\n\n"
-            )
-            log_box.see(tk.END)
-        except Exception as e:
-            log_box.insert(tk.END, f"[ERROR] CSV write failed for model '{model_name}': {str(e)}\n")
-    else:
-        log_box.insert(tk.END, f"[{model_name}] No new prompts generated; nothing saved.\n")
+    # The final prompt depends on the batch size and, with memory on, on the memory;
+    # it is rebuilt only when one of them has changed since the last call
+    final_prompt = None
+    prompt_state = None
+
+    # One keep-alive connection for the whole loop (no process spawn per prompt),
+    # to the server OLLAMA_HOST names (read the way the ollama CLI reads it)
+    conn = ollama_connection(timeout=600)
+
+    # Set after a duplicate so the next attempt samples more freely
+    options = None
+
+    # Last progress posted, to skip redundant progress bar redraws
+    last_progress = None
+    last_progress_time = 0.0
+
+    # CSV is opened on the first accepted prompt, so an empty run leaves the file untouched
+    csvfile = None
+    writer = None
+    csv_failed = False
+
+    try:
+        # Start generation loop
+        while generated < total_prompts and attempts < max_attempts:
+            if stop_generation:
+                log_queue.put(f"\n[INFO] Generation for model '{model_name}' stopped by user.\n")
+                break
+
+            # Ask for several prompts per call, but no more than are still needed.
+            # Every requested prompt counts toward max_attempts.
+            batch_size = min(total_prompts - generated, PROMPTS_PER_CALL)
+            attempts += batch_size
+
+            memory_len = len(ALL_PROMPTS_MEMORY[model_name]) if use_memory else 0
+            if prompt_state != (batch_size, memory_len):
+                prompt_state = (batch_size, memory_len)
+                if use_memory:
+                    system_part = build_system_prompt_with_memory(model_name, base_prompt_text)
+                else:
+                    system_part = base_prompt_text
+                user_part = build_user_prompt(reference_text, batch_size)
+                final_prompt = f"{system_part}\n\n{user_part}\n"
+
+            # Call Ollama through its HTTP API (prompt goes in the request body, so no WinError 206)
+            try:
+                response_text = ollama_generate(conn, model_name, final_prompt, options).strip()
+            except Exception as e:
+                log_queue.put(f"[ERROR] Ollama call failed for model '{model_name}': {str(e)}\n")
+                break
+
+            candidates = [parsed for parsed in map(parse_ollama_output, split_ollama_prompts(response_text)) if parsed]
+            if not candidates:
+                # fallback: store entire text as UNPARSED
+                candidates = [{
+                    "title": "UNPARSED",
+                    "description": response_text,
+                    "style": ""
+                }]
+
+            # Go back to the model's default sampling unless this batch had a duplicate
+            options = None
+
+            for parsed in candidates[:batch_size]:
+                # Check duplicates against memory if it's on, otherwise against this run
+                key = prompt_key(parsed)
+                if use_memory:
+                    is_duplicate = key in ALL_PROMPTS_SEEN[model_name]
+                else:
+                    is_duplicate = key in seen_this_run
+
+                if is_duplicate:
+                    log_queue.put(f"[{model_name}] Attempt {attempts}: Found duplicate, skipping.\n")
+                    options = DUPLICATE_RETRY_OPTIONS
+                    continue
+
+                # It's new, add it
+                generated += 1
+                seen_this_run.add(key)
+                if use_memory:
+                    ALL_PROMPTS_MEMORY[model_name].append(parsed)
+                    ALL_PROMPTS_SEEN[model_name].add(key)
+
+                # Write the row right away so a crash doesn't lose the run
+                if not csv_failed:
+                    try:
+                        if writer is None:
+                            csvfile, writer = open_prompts_csv(output_csv, save_mode)
+                        writer.writerow((parsed["title"], parsed["description"], parsed["style"]))
+                        if generated % 16 == 0:
+                            csvfile.flush()
+                    except Exception as e:
+                        csv_failed = True
+                        log_queue.put(f"[ERROR] CSV write failed for model '{model_name}': {str(e)}\n")
+
+                log_queue.put(
+                    f"[{model_name}] Prompt #{generated}/{total_prompts}\n"
+                    f"Title: {parsed['title']}\n"
+                    f"Description: {parsed['description']}\n"
+                    f"Style: {parsed['style']}\n\n"
+                )
+
+                # Update progress bar (for single-model scenario, or partial for multi-model)
+                # We won't do a perfect 2-model combined progress. We'll just show each model's local progress.
+                # Only post when the percentage changed, at most every PROGRESS_INTERVAL seconds.
+                progress_value = int((generated / total_prompts) * 100)
+                now = time.monotonic()
+                if progress_value != last_progress and now - last_progress_time >= PROGRESS_INTERVAL:
+                    progress_updates[progress_bar] = progress_value
+                    last_progress = progress_value
+                    last_progress_time = now
+    finally:
+        conn.close()
+        if csvfile is not None:
+            csvfile.close()
+        # Make sure the bar ends on the final value even if it was throttled
+        if generated and last_progress != int((generated / total_prompts) * 100):
+            progress_updates[progress_bar] = int((generated / total_prompts) * 100)
+
+    if not generated:
+        log_queue.put(f"[{model_name}] No new prompts generated; nothing saved.\n")
+    elif not csv_failed:
+        log_queue.put(f"[{model_name}] Saved {generated} prompts to {output_csv}.\n\n")
 
 # ======================================
-# THREAD TARGET FOR (ONE OR TWO) MODELS
+# THREAD TARGET FOR (ONE OR MORE) MODELS
 # ======================================
 def generate_prompts_threaded(gui_elements):
     """
     Top-level function invoked in a background thread.
-    Checks whether user selected one model or two models,
-    then calls generate_prompts_for_model accordingly.
+    Collects one configuration per selected model, validates them,
+    then runs generate_prompts_for_model for each on a worker pool.
     """
     global stop_generation
     stop_generation = False
@@ -268,108 +502,56 @@ def generate_prompts_threaded(gui_elements):
     use_memory = (gui_elements["use_memory_var"].get() == 1)
     reference_text = gui_elements["reference_prompt_text"].get("1.0", tk.END).strip()
     save_mode = gui_elements["save_mode_var"].get()
-    log_box = gui_elements["log_box"]
 
-    # We'll store threads in a list if user selected two models
-    threads = []
+    # Model slots to run: just #1, or #1 and #2
+    slots = [1] if number_of_models == "one" else [1, 2]
 
-    if number_of_models == "one":
-        # Single model
-        model_name = gui_elements["model1_var"].get().strip()
-        num_prompts = int(gui_elements["prompt_count1_var"].get())
-        output_csv = gui_elements["output_file1_var"].get().strip()
+    # Collect (model_name, num_prompts, output_csv, progress_bar) per slot
+    configs = []
+    for n in slots:
+        model_name = gui_elements[f"model{n}_var"].get().strip()
+        num_prompts = int(gui_elements[f"prompt_count{n}_var"].get())
+        output_csv = gui_elements[f"output_file{n}_var"].get().strip()
 
         # Basic checks
         if not model_name:
-            log_box.insert(tk.END, "[ERROR] Model #1 name cannot be empty.\n")
+            log_queue.put(f"[ERROR] Model #{n} name cannot be empty.\n")
             return
         if num_prompts < 1:
-            log_box.insert(tk.END, "[ERROR] Number of prompts for Model #1 must be >= 1.\n")
+            log_queue.put(f"[ERROR] Number of prompts for Model #{n} must be >= 1.\n")
             return
         if not output_csv:
-            log_box.insert(tk.END, "[ERROR] Output CSV for Model #1 cannot be empty.\n")
-            return
-
-        # Call generation for single model on the current thread
-        generate_prompts_for_model(
-            model_name=model_name,
-            num_prompts=num_prompts,
-            output_csv=output_csv,
-            reference_text=reference_text,
-            use_memory=use_memory,
-            save_mode=save_mode,
-            log_box=log_box,
-            progress_bar=gui_elements["progress_bar1"]
-        )
-    else:
-        # Two models in parallel
-        model_name1 = gui_elements["model1_var"].get().strip()
-        num_prompts1 = int(gui_elements["prompt_count1_var"].get())
-        output_csv1 = gui_elements["output_file1_var"].get().strip()
-
-        model_name2 = gui_elements["model2_var"].get().strip()
-        num_prompts2 = int(gui_elements["prompt_count2_var"].get())
-        output_csv2 = gui_elements["output_file2_var"].get().strip()
-
-        # Basic checks for model 1
-        if not model_name1:
-            log_box.insert(tk.END, "[ERROR] Model #1 name cannot be empty.\n")
-            return
-        if num_prompts1 < 1:
-            log_box.insert(tk.END, "[ERROR] Number of prompts for Model #1 must be >= 1.\n")
-            return
-        if not output_csv1:
-            log_box.insert(tk.END, "[ERROR] Output CSV for Model #1 cannot be empty.\n")
+            log_queue.put(f"[ERROR] Output CSV for Model #{n} cannot be empty.\n")
             return
 
-        # Basic checks for model 2
-        if not model_name2:
-            log_box.insert(tk.END, "[ERROR] Model #2 name cannot be empty.\n")
-            return
-        if num_prompts2 < 1:
-            log_box.insert(tk.END, "[ERROR] Number of prompts for Model #2 must be >= 1.\n")
-            return
-        if not output_csv2:
-            log_box.insert(tk.END, "[ERROR] Output CSV for Model #2 cannot be empty.\n")
-            return
-
-        # We'll spawn two separate threads
-        def worker1():
-            generate_prompts_for_model(
-                model_name=model_name1,
-                num_prompts=num_prompts1,
-                output_csv=output_csv1,
-                reference_text=reference_text,
-                use_memory=use_memory,
-                save_mode=save_mode,
-                log_box=log_box,
-                progress_bar=gui_elements["progress_bar1"]
-            )
-
-        def worker2():
-            generate_prompts_for_model(
-                model_name=model_name2,
-                num_prompts=num_prompts2,
-                output_csv=output_csv2,
+        configs.append((model_name, num_prompts, output_csv, gui_elements[f"progress_bar{n}"]))
+
+    # Each worker mostly waits on Ollama, so run all models side by side
+    max_workers = min(len(configs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                generate_prompts_for_model,
+                model_name=model_name,
+                num_prompts=num_prompts,
+                output_csv=output_csv,
                 reference_text=reference_text,
                 use_memory=use_memory,
                 save_mode=save_mode,
-                log_box=log_box,
-                progress_bar=gui_elements["progress_bar2"]
-            )
-
-        t1 = threading.Thread(target=worker1)
-        t2 = threading.Thread(target=worker2)
-        threads.extend([t1, t2])
-
-        for t in threads:
-            t.start()
-
-        for t in threads:
-            t.join()
-
-    log_box.insert(tk.END, "[INFO] Generation process finished.\n")
-    log_box.see(tk.END)
+                progress_bar=progress_bar
+            ): model_name
+            for model_name, num_prompts, output_csv, progress_bar in configs
+        }
+        for future in as_completed(futures):
+            model_name = futures[future]
+            try:
+                future.result()
+                if len(configs) > 1:
+                    log_queue.put(f"[INFO] Model '{model_name}' finished.\n")
+            except Exception as e:
+                log_queue.put(f"[ERROR] Generation failed for model '{model_name}': {str(e)}\n")
+
+    log_queue.put("[INFO] Generation process finished.\n")
 
 def start_generation(gui_elements):
     """
@@ -533,7 +715,6 @@ def main():
             "use_memory_var": use_memory_var,
             "save_mode_var": save_mode_var,
             "reference_prompt_text": reference_prompt_text,
-            "log_box": log_box,
             # We'll store two separate progress bars for each model
             "progress_bar1": progress_bar1,
             "progress_bar2": progress_bar2
@@ -546,7 +727,7 @@ def main():
 
     reset_button = ttk.Button(
         action_frame, text="Reset Memory",
-        command=lambda: reset_memory_func({"log_box": log_box})
+        command=reset_memory_func
     )
     reset_button.pack(side=tk.LEFT, padx=5)
 
@@ -563,10 +744,38 @@ def main():
     log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL)
     log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-    log_box = tk.Text(log_frame, wrap=tk.WORD, yscrollcommand=log_scrollbar.set)
+    # Read-only except while _drain_log writes to it
+    log_box = tk.Text(log_frame, wrap=tk.WORD, yscrollcommand=log_scrollbar.set, state="disabled")
     log_box.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     log_scrollbar.config(command=log_box.yview)
 
+    # Tk widgets may only be touched from this thread: move queued log text
+    # into the log box every 50 ms, as one insert per tick, and apply the
+    # latest progress posted by the workers
+    def _drain_log():
+        while progress_updates:
+            bar, value = progress_updates.popitem()
+            bar["value"] = value
+
+        chunks = []
+        while True:
+            try:
+                chunks.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if chunks:
+            log_box.configure(state="normal")
+            log_box.insert(tk.END, "".join(chunks))
+            # Keep the widget bounded: drop the oldest lines past LOG_MAX_LINES
+            lines = int(log_box.index("end-1c").split(".")[0])
+            if lines > LOG_MAX_LINES:
+                log_box.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
+            log_box.configure(state="disabled")
+            log_box.see(tk.END)
+        root.after(50, _drain_log)
+
+    _drain_log()
+
     root.mainloop()
 
 if __name__ == "__main__":
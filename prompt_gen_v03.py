@@ -1,22 +1,139 @@
 import os
-import re
+import sys
 import csv
-import subprocess
+import functools
+import hashlib
+import json
+import re
 import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import http.client
 import tkinter as tk
 from tkinter import ttk, filedialog
 
+# Shared with prompt_gen1: OLLAMA_HOST parsing and readable API errors
+from ollama_api import ollama_connection, ollama_endpoint, ollama_http_error
+
 # ======================================
 # GLOBALS
 # ======================================
 stop_generation = False
 
-# Dictionary of memory per model: { model_name: [ {title, description, style}, ... ] }
+# One generated prompt; a tuple is far smaller than a dict per prompt and hashes as the duplicate key
+Prompt = namedtuple("Prompt", "title description style")
+
+# Dictionary of memory per model: { model_name: [ Prompt, ... ] }
 ALL_PROMPTS_MEMORY = {}
 
+# Same prompts as a set for O(1) duplicate checks: { model_name: set() }
+ALL_PROMPTS_SEEN = {}
+
+# Last MEMORY_PROMPT_WINDOW memory entries rendered as system-prompt lines:
+# { model_name: [ rendered_count, deque([ "1) title | description | style", ... ]) ] }.
+# Kept in step with ALL_PROMPTS_MEMORY so each prompt is formatted once, not on every call.
+_MEMORY_LINES = {}
+
+# Held while a _MEMORY_LINES entry is checked and extended: workers for the same
+# model run side by side and would otherwise both render the same new entries
+_MEMORY_LINES_LOCK = threading.Lock()
+
+# How many of the most recent memory entries go into the system prompt.
+# Duplicate checks still use the whole history in ALL_PROMPTS_SEEN.
+MEMORY_PROMPT_WINDOW = 512
+
+# Latest percentage per progress bar posted by workers; applied by flush_logs on the Tk thread: { progress_bar: value }
+progress_updates = {}
+
+# CSV paths already saved to during the current run.
+# Later auto-saves in the same run append without re-checking the folder or header.
+_CSV_STATE = set()
+
+# Line prefixes parse_ollama_output looks for (compared lower-cased) and the field each fills
+_FIELD_PREFIXES = (
+    ("title:", "title"),
+    ("description:", "description"),
+    ("style:", "style"),
+)
+
+# A finished, non-empty "Style:" line (same rules as parse_ollama_output: any
+# indentation, any case). Streaming only re-parses once this shows up.
+_STYLE_LINE_RE = re.compile(r"^[^\S\n]*style:[^\n]*?\S[^\n]*\n", re.IGNORECASE | re.MULTILINE)
+
+# ======================================
+# LOG BUFFER
+# ======================================
+class LogBuffer:
+    """
+    Pending text for one log box. Any thread may append; the Tk main loop
+    calls flush() periodically, which writes everything in one insert.
+    """
+    def __init__(self, log_box: tk.Text):
+        self.log_box = log_box
+        self.pending = deque()
+        self.lock = threading.Lock()
+
+    def append(self, text: str):
+        with self.lock:
+            self.pending.append(text)
+
+    def flush(self, auto_scroll: bool):
+        """
+        Must run on the Tk thread. Only scrolls if auto-scroll is on and the
+        user hasn't scrolled up to read older lines.
+        """
+        with self.lock:
+            if not self.pending:
+                return
+            text = "".join(self.pending)
+            self.pending.clear()
+        at_bottom = self.log_box.yview()[1] >= 1.0
+        self.log_box.insert(tk.END, text)
+        if auto_scroll and at_bottom:
+            self.log_box.see(tk.END)
+
 # ======================================
 # HELPER: parse_ollama_output
 # ======================================
+@functools.lru_cache(maxsize=1024)
+def _parse_fields(response: str):
+    """
+    Cached core of parse_ollama_output: returns (title, description, style)
+    or None. A model stuck repeating itself sends the same text again, and
+    that is then a dict lookup instead of another parse.
+    """
+    # Responses are a few short lines, so plain prefix checks beat a regex scan.
+    # Keep the first non-empty value of each field.
+    fields = {}
+    for line in response.splitlines():
+        stripped = line.lstrip()
+        head = stripped[:12].lower()
+        for prefix, name in _FIELD_PREFIXES:
+            if head.startswith(prefix):
+                if name not in fields:
+                    value = stripped[len(prefix):].strip()
+                    if name == "title":
+                        # Drop one pair of optional quotes around the title
+                        if value[:1] in ('"', '“'):
+                            value = value[1:]
+                        if value[-1:] in ('"', '”'):
+                            value = value[:-1]
+                        value = value.strip()
+                    if value:
+                        fields[name] = value
+                break
+        if len(fields) == 3:
+            break
+
+    title = fields.get("title", "")
+    desc  = fields.get("description", "")
+    style = fields.get("style", "")
+
+    if not title and not desc and not style:
+        return None
+
+    return title, desc, style
+
 def parse_ollama_output(response: str):
     """
     Attempt to parse lines like:
@@ -25,26 +142,28 @@ def parse_ollama_output(response: str):
       Style: ...
     Return a dict {title, description, style} or None if not found.
     """
-    title_match = re.search(r'(?im)^\s*Title:\s*["“]?(.+?)["”]?\s*$', response)
-    desc_match  = re.search(r'(?im)^\s*Description:\s*(.+)$', response)
-    style_match = re.search(r'(?im)^\s*Style:\s*(.+)$', response)
-
-    if not title_match and not desc_match and not style_match:
-        return None
-
-    title = title_match.group(1).strip() if title_match else ""
-    desc  = desc_match.group(1).strip()  if desc_match else ""
-    style = style_match.group(1).strip() if style_match else ""
-
-    if not title and not desc and not style:
+    fields = _parse_fields(response)
+    if fields is None:
         return None
 
+    # Fresh dict per call, so callers can't alter the cached result
+    title, desc, style = fields
     return {
         "title": title,
         "description": desc,
         "style": style
     }
 
+def prompt_key(prompt: Prompt):
+    """
+    Fixed-size key for the per-run duplicate check: a 16-byte blake2b digest
+    of title, description and style. Once a batch is auto-saved the set is
+    the only thing still holding this run's prompts, so it keeps digests
+    rather than every full description.
+    """
+    text = f"{prompt.title}\x00{prompt.description}\x00{prompt.style}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
 # ======================================
 # PROMPT BUILDING
 # ======================================
@@ -62,6 +181,62 @@ Description: (20 words max, photorealistic)
 Style: (1-3 words, e.g. cinematic, macro, surreal)
 """
 
+def ollama_generate(conn: http.client.HTTPConnection, model_name: str, prompt: str):
+    """
+    Send one prompt to the Ollama HTTP API over a kept-alive connection
+    and return the response text. Reconnects once if the server dropped
+    the idle connection.
+    The answer is streamed: once a finished Style line has shown up and the
+    text so far holds a Title, Description and Style, the connection is
+    closed so Ollama stops generating whatever commentary would follow.
+    A timeout mid-stream returns what arrived so far.
+    """
+    body = json.dumps({"model": model_name, "prompt": prompt, "stream": True})
+    headers = {"Content-Type": "application/json"}
+    for attempt in range(2):
+        try:
+            conn.request("POST", ollama_endpoint("/api/generate"), body=body, headers=headers)
+            response = conn.getresponse()
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if attempt:
+                raise
+    if response.status != 200:
+        raise ollama_http_error(response.status, response.read(), model_name)
+
+    # One JSON object per line, each carrying the next piece of the answer
+    pieces = []
+    # Start of the line not yet checked for a finished Style line
+    scan_from = 0
+    style_seen = False
+    try:
+        for line in response:
+            if not line.strip():
+                continue
+            chunk = json.loads(line)
+            piece = chunk.get("response", "")
+            pieces.append(piece)
+            if chunk.get("done"):
+                # Read the end of the stream so the connection can be reused
+                response.read()
+                break
+            if "\n" in piece:
+                text = "".join(pieces)
+                if not style_seen:
+                    style_seen = _STYLE_LINE_RE.search(text, scan_from) is not None
+                scan_from = text.rfind("\n") + 1
+                if style_seen:
+                    parsed = parse_ollama_output(text[:scan_from])
+                    if parsed and all(parsed.values()):
+                        # Closing the connection cancels the rest of the generation;
+                        # the next request opens a new one
+                        conn.close()
+                        break
+    except TimeoutError:
+        conn.close()
+    return "".join(pieces)
+
 def build_system_prompt_with_memory(model_name: str, basic_prompt: str):
     """
     Incorporate memory for a specific model, if any.
@@ -69,10 +244,24 @@ def build_system_prompt_with_memory(model_name: str, basic_prompt: str):
     if model_name not in ALL_PROMPTS_MEMORY or not ALL_PROMPTS_MEMORY[model_name]:
         return basic_prompt
 
-    memory_text = "\n".join(
-        f"{idx+1}) {p['title']} | {p['description']} | {p['style']}"
-        for idx, p in enumerate(ALL_PROMPTS_MEMORY[model_name])
-    )
+    memory = ALL_PROMPTS_MEMORY[model_name]
+    with _MEMORY_LINES_LOCK:
+        state = _MEMORY_LINES.get(model_name)
+        if state is None or state[0] > len(memory):
+            # First call, or memory shrank under us: render from scratch
+            state = _MEMORY_LINES[model_name] = [0, deque(maxlen=MEMORY_PROMPT_WINDOW)]
+        rendered, lines = state
+        # Only render the prompts added since the last call, and of those only the
+        # ones still inside the window; the deque drops lines that fall out of it.
+        # Show the model only the most recent entries so the prompt stops growing with memory
+        end = len(memory)
+        start = max(rendered, end - MEMORY_PROMPT_WINDOW)
+        lines.extend(
+            f"{idx+1}) {p.title} | {p.description} | {p.style}"
+            for idx, p in enumerate(memory[start:end], start=start)
+        )
+        state[0] = end
+        memory_text = "\n".join(lines)
 
     return f"""SYSTEM:
 You are an AI specialized in creating random, photorealistic prompts.
@@ -93,60 +282,53 @@ def reset_memory_func(gui_elements):
     """
     global ALL_PROMPTS_MEMORY
     ALL_PROMPTS_MEMORY.clear()
+    ALL_PROMPTS_SEEN.clear()
+    with _MEMORY_LINES_LOCK:
+        _MEMORY_LINES.clear()
 
-    model1_log_box = gui_elements["model1_log_box"]
-    model2_log_box = gui_elements["model2_log_box"]
     msg = "[INFO] All memory has been reset.\n"
-    model1_log_box.insert(tk.END, msg)
-    model2_log_box.insert(tk.END, msg)
-
-    if gui_elements["auto_scroll_var"].get() == 1:
-        model1_log_box.see(tk.END)
-        model2_log_box.see(tk.END)
+    gui_elements["model1_log"].append(msg)
+    gui_elements["model2_log"].append(msg)
 
 def show_memory_func(gui_elements):
     """
     Logs all memory content to both model logs.
     """
     global ALL_PROMPTS_MEMORY
-    model1_log_box = gui_elements["model1_log_box"]
-    model2_log_box = gui_elements["model2_log_box"]
 
+    # Build the whole listing first, then hand it to each log in one piece
+    lines = []
     if not ALL_PROMPTS_MEMORY:
-        msg = "[INFO] No memory stored for any model.\n"
-        model1_log_box.insert(tk.END, msg)
-        model2_log_box.insert(tk.END, msg)
+        lines.append("[INFO] No memory stored for any model.\n")
     else:
-        msg = "[INFO] Current stored memory:\n"
-        model1_log_box.insert(tk.END, msg)
-        model2_log_box.insert(tk.END, msg)
+        lines.append("[INFO] Current stored memory:\n")
         for model, prompts in ALL_PROMPTS_MEMORY.items():
-            line = f" Model: {model}\n"
-            model1_log_box.insert(tk.END, line)
-            model2_log_box.insert(tk.END, line)
+            lines.append(f" Model: {model}\n")
             if not prompts:
-                subline = "   (no prompts)\n"
-                model1_log_box.insert(tk.END, subline)
-                model2_log_box.insert(tk.END, subline)
+                lines.append("   (no prompts)\n")
             else:
                 for idx, p in enumerate(prompts, start=1):
-                    entry = (
-                        f"   {idx}) Title:{p['title']}\n"
-                        f"      Description:{p['description']}\n"
-                        f"      Style:{p['style']}\n"
+                    lines.append(
+                        f"   {idx}) Title:{p.title}\n"
+                        f"      Description:{p.description}\n"
+                        f"      Style:{p.style}\n"
                     )
-                    model1_log_box.insert(tk.END, entry)
-                    model2_log_box.insert(tk.END, entry)
 
-    if gui_elements["auto_scroll_var"].get() == 1:
-        model1_log_box.see(tk.END)
-        model2_log_box.see(tk.END)
+    text = "".join(lines)
+    gui_elements["model1_log"].append(text)
+    gui_elements["model2_log"].append(text)
 
 # ======================================
 # SAVE PROMPTS
 # ======================================
+def needs_csv_quoting(value: str):
+    """
+    True if csv.writer (default dialect) would quote this cell.
+    """
+    return "," in value or '"' in value or "\n" in value or "\r" in value
+
 def save_prompts_to_csv(
-    prompts_list, output_csv, save_mode, model_name, log_box, auto_scroll
+    prompts_list, output_csv, save_mode, model_name, log
 ):
     """
     Writes the given prompts_list to CSV, then clears it.
@@ -154,40 +336,40 @@ def save_prompts_to_csv(
     if not prompts_list:
         return
 
-    # Ensure folder exists
-    dirpath = os.path.dirname(output_csv)
-    if dirpath and not os.path.exists(dirpath):
-        os.makedirs(dirpath, exist_ok=True)
-
-    file_mode = "a" if save_mode == "append" else "w"
-    write_header = True
-    if file_mode == "a" and os.path.exists(output_csv):
-        write_header = False
-
     try:
-        with open(output_csv, mode=file_mode, newline="", encoding="utf-8") as csvfile:
-            fieldnames = ["Title", "Description", "Style"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            if write_header:
-                writer.writeheader()
-            for p in prompts_list:
-                writer.writerow({
-                    "Title": p["title"],
-                    "Description": p["description"],
-                    "Style": p["style"]
-                })
-        log_box.insert(
-            tk.END, f"[{model_name}] Auto-saved {len(prompts_list)} prompts to {output_csv}.\n"
-        )
-        if auto_scroll:
-            log_box.see(tk.END)
+        started = output_csv in _CSV_STATE
+        if not started:
+            # First save of this run: ensure folder exists, and honour the save mode
+            dirpath = os.path.dirname(output_csv)
+            if dirpath:
+                os.makedirs(dirpath, exist_ok=True)
+            file_mode = "a" if save_mode == "append" else "w"
+        else:
+            # Later saves of the same run add to what this run already wrote
+            file_mode = "a"
+
+        # Large write buffer: the whole batch goes out in a few write() calls
+        with open(output_csv, mode=file_mode, newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+            # Header only at the start of a new or emptied file (append mode opens at the end)
+            write_header = not started and csvfile.tell() == 0
+            # Prompt tuples are already rows in column order
+            if not any(needs_csv_quoting(value) for row in prompts_list for value in row):
+                # Nothing to quote: write the rows directly, byte for byte what
+                # csv.writer would produce, without its per-cell quoting checks
+                if write_header:
+                    csvfile.write("Title,Description,Style\r\n")
+                csvfile.write("".join(",".join(row) + "\r\n" for row in prompts_list))
+            else:
+                # Fixed columns, so rows are plain (title, description, style) tuples
+                writer = csv.writer(csvfile)
+                if write_header:
+                    writer.writerow(("Title", "Description", "Style"))
+                writer.writerows(prompts_list)
+        _CSV_STATE.add(output_csv)
+        log.append(f"[{model_name}] Auto-saved {len(prompts_list)} prompts to {output_csv}.\n")
 
     except Exception as e:
-        log_box.insert(
-            tk.END, f"[ERROR] CSV write failed for model '{model_name}': {str(e)}\n"
-        )
-        if auto_scroll:
-            log_box.see(tk.END)
+        log.append(f"[ERROR] CSV write failed for model '{model_name}': {str(e)}\n")
 
     prompts_list.clear()
 
@@ -201,9 +383,8 @@ def generate_prompts_for_model(
     reference_text: str,
     use_memory: bool,
     save_mode: str,
-    log_box: tk.Text,
+    log: LogBuffer,
     progress_bar: ttk.Progressbar,
-    auto_scroll: bool,
     auto_save_every: int
 ):
     """
@@ -212,122 +393,119 @@ def generate_prompts_for_model(
     """
     global stop_generation, ALL_PROMPTS_MEMORY
 
-    # Memory if not present yet
-    if model_name not in ALL_PROMPTS_MEMORY:
-        ALL_PROMPTS_MEMORY[model_name] = []
+    # Memory if not present yet; setdefault is atomic, so two workers on the
+    # same model can't each install their own list/set and lose the other's entries
+    ALL_PROMPTS_MEMORY.setdefault(model_name, [])
+    ALL_PROMPTS_SEEN.setdefault(model_name, set())
 
-    # We'll keep a local list for unsaved prompts
+    # We'll keep a local list for unsaved prompts (emptied on each auto-save),
+    # and the prompt_key digests of everything generated this run for duplicate checks
     new_prompts_this_run = []
+    seen_this_run = set()
+
+    # New run: the first save decides overwrite/append and the header again
+    _CSV_STATE.discard(output_csv)
     base_prompt_text = build_basic_system_prompt()
 
+    # Build final user instructions (the same for every attempt)
+    if reference_text.strip():
+        user_part = f"USER:\nIncorporate this reference: '{reference_text}'\nGenerate 1 new prompt.\nTitle:\nDescription:\nStyle:"
+    else:
+        user_part = "USER:\nGenerate 1 new random prompt.\nTitle:\nDescription:\nStyle:"
+
+    # The final prompt only changes when memory grows, so it is rebuilt
+    # just then (memory_len is the memory size it was built for)
+    final_prompt = None
+    memory_len = None
+
     # We'll keep an overall prompt_index from 1..num_prompts
     prompt_index = 0
     attempts = 0
     max_attempts = num_prompts * 3
 
-    while prompt_index < num_prompts and attempts < max_attempts:
-        if stop_generation:
-            log_box.insert(tk.END, f"\n[INFO] Generation for model '{model_name}' stopped by user.\n")
-            if auto_scroll:
-                log_box.see(tk.END)
-            break
-
-        attempts += 1
-
-        # Possibly build memory-based system prompt
-        if use_memory:
-            system_part = build_system_prompt_with_memory(model_name, base_prompt_text)
-        else:
-            system_part = base_prompt_text
-
-        # Build final user instructions
-        if reference_text.strip():
-            user_part = f"USER:\nIncorporate this reference: '{reference_text}'\nGenerate 1 new prompt.\nTitle:\nDescription:\nStyle:"
-        else:
-            user_part = "USER:\nGenerate 1 new random prompt.\nTitle:\nDescription:\nStyle:"
+    # One keep-alive connection for the whole loop (no process spawn per prompt),
+    # to the server OLLAMA_HOST names (read the way the ollama CLI reads it)
+    conn = ollama_connection(timeout=600)
 
-        final_prompt = f"{system_part}\n\n{user_part}\n"
-
-        try:
-            result = subprocess.run(
-                ["ollama", "run", model_name],
-                input=final_prompt,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace"
-            )
-            response_text = result.stdout.strip()
-        except Exception as e:
-            log_box.insert(tk.END, f"[ERROR] Ollama call failed for model '{model_name}': {str(e)}\n")
-            if auto_scroll:
-                log_box.see(tk.END)
-            break
+    try:
+        while prompt_index < num_prompts and attempts < max_attempts:
+            if stop_generation:
+                log.append(f"\n[INFO] Generation for model '{model_name}' stopped by user.\n")
+                break
+
+            attempts += 1
+
+            # Possibly build memory-based system prompt
+            if final_prompt is None or (use_memory and memory_len != len(ALL_PROMPTS_MEMORY[model_name])):
+                if use_memory:
+                    memory_len = len(ALL_PROMPTS_MEMORY[model_name])
+                    system_part = build_system_prompt_with_memory(model_name, base_prompt_text)
+                else:
+                    system_part = base_prompt_text
+                final_prompt = f"{system_part}\n\n{user_part}\n"
+
+            # Call Ollama through its HTTP API (prompt goes in the request body, so no WinError 206)
+            try:
+                response_text = ollama_generate(conn, model_name, final_prompt).strip()
+            except Exception as e:
+                log.append(f"[ERROR] Ollama call failed for model '{model_name}': {str(e)}\n")
+                break
+
+            parsed = parse_ollama_output(response_text)
+            if parsed:
+                # Styles repeat a lot ("cinematic", ...): intern so memory shares one string each
+                prompt = Prompt(parsed["title"], parsed["description"], sys.intern(parsed["style"]))
+            else:
+                prompt = Prompt("UNPARSED", response_text, "")
 
-        parsed = parse_ollama_output(response_text)
-        if not parsed:
-            parsed = {
-                "title": "UNPARSED",
-                "description": response_text,
-                "style": ""
-            }
-
-        # Check duplicates if memory is on
-        if use_memory:
-            is_duplicate = any(
-                p["title"] == parsed["title"]
-                and p["description"] == parsed["description"]
-                and p["style"] == parsed["style"]
-                for p in ALL_PROMPTS_MEMORY[model_name]
-            )
-        else:
-            is_duplicate = any(
-                p["title"] == parsed["title"]
-                and p["description"] == parsed["description"]
-                and p["style"] == parsed["style"]
-                for p in new_prompts_this_run
+            # Check duplicates against memory if it's on, otherwise against this run.
+            # Memory keeps the prompts anyway, so its set shares those tuples;
+            # the per-run set stores digests.
+            if use_memory:
+                is_duplicate = prompt in ALL_PROMPTS_SEEN[model_name]
+            else:
+                key = prompt_key(prompt)
+                is_duplicate = key in seen_this_run
+
+            if is_duplicate:
+                log.append(f"[{model_name}] Attempt {attempts}: Found duplicate, skipping.\n")
+                continue
+
+            # It's new, so increment the overall index
+            prompt_index += 1
+
+            # Add to local list
+            new_prompts_this_run.append(prompt)
+            # Add to memory if needed
+            if use_memory:
+                ALL_PROMPTS_MEMORY[model_name].append(prompt)
+                ALL_PROMPTS_SEEN[model_name].add(prompt)
+            else:
+                seen_this_run.add(key)
+
+            # Log with the correct numbering
+            log.append(
+                f"[{model_name}] Prompt #{prompt_index}/{num_prompts}\n"
+                f"Title: {prompt.title}\n"
+                f"Description: {prompt.description}\n"
+                f"Style: {prompt.style}\n\n"
             )
 
-        if is_duplicate:
-            log_box.insert(tk.END, f"[{model_name}] Attempt {attempts}: Found duplicate, skipping.\n")
-            if auto_scroll:
-                log_box.see(tk.END)
-            continue
-
-        # It's new, so increment the overall index
-        prompt_index += 1
-
-        # Add to local list
-        new_prompts_this_run.append(parsed)
-        # Add to memory if needed
-        if use_memory:
-            ALL_PROMPTS_MEMORY[model_name].append(parsed)
-
-        # Log with the correct numbering
-        log_box.insert(
-            tk.END,
-            f"[{model_name}] Prompt #{prompt_index}/{num_prompts}\n"
-            f"Title: {parsed['title']}\n"
-            f"Description: {parsed['description']}\n"
-            f"Style: {parsed['style']}\n\n"
-        )
-        if auto_scroll:
-            log_box.see(tk.END)
-
-        # Update progress bar
-        progress_value = int((prompt_index / num_prompts) * 100)
-        progress_bar["value"] = progress_value
-
-        # Auto-save if we've reached a multiple
-        if auto_save_every > 0 and (prompt_index % auto_save_every == 0):
-            save_prompts_to_csv(
-                prompts_list=new_prompts_this_run,
-                output_csv=output_csv,
-                save_mode=save_mode,
-                model_name=model_name,
-                log_box=log_box,
-                auto_scroll=auto_scroll
-            )
+            # Post progress; the Tk loop shows the latest value on its next tick,
+            # so the bar redraws at most once per tick however fast prompts come
+            progress_updates[progress_bar] = int((prompt_index / num_prompts) * 100)
+
+            # Auto-save if we've reached a multiple
+            if auto_save_every > 0 and (prompt_index % auto_save_every == 0):
+                save_prompts_to_csv(
+                    prompts_list=new_prompts_this_run,
+                    output_csv=output_csv,
+                    save_mode=save_mode,
+                    model_name=model_name,
+                    log=log
+                )
+    finally:
+        conn.close()
 
     # Final save of any leftover prompts
     if new_prompts_this_run:
@@ -336,27 +514,22 @@ def generate_prompts_for_model(
             output_csv=output_csv,
             save_mode=save_mode,
             model_name=model_name,
-            log_box=log_box,
-            auto_scroll=auto_scroll
+            log=log
         )
     else:
-        log_box.insert(tk.END, f"[{model_name}] No new prompts left to save.\n")
-        if auto_scroll:
-            log_box.see(tk.END)
+        log.append(f"[{model_name}] No new prompts left to save.\n")
 
 # ======================================
 # THREAD TARGET FOR 1 OR 2 MODELS
 # ======================================
-def generate_prompts_threaded(gui_elements):
+def read_generation_jobs(gui_elements):
     """
-    Called in background thread. If 'two' models, run each in parallel.
+    Reads every setting from the GUI in one go and returns one job per
+    selected model: (label, generate_prompts_for_model kwargs, log).
+    Call it on the Tk thread; the workers then never touch a Tk variable.
     """
-    global stop_generation
-    stop_generation = False
-
     use_memory = (gui_elements["use_memory_var"].get() == 1)
     save_mode = gui_elements["save_mode_var"].get()
-    auto_scroll = (gui_elements["auto_scroll_var"].get() == 1)
     auto_save_every_str = gui_elements["auto_save_every_var"].get()
 
     try:
@@ -370,7 +543,7 @@ def generate_prompts_threaded(gui_elements):
     model1_name = gui_elements["model1_var"].get().strip()
     model1_count = int(gui_elements["prompt_count1_var"].get())
     model1_csv = gui_elements["output_file1_var"].get().strip()
-    model1_log_box = gui_elements["model1_log_box"]
+    model1_log = gui_elements["model1_log"]
     progress_bar1 = gui_elements["progress_bar1"]
     reference1_text = gui_elements["reference1_text"].get("1.0", tk.END).strip()
 
@@ -378,66 +551,67 @@ def generate_prompts_threaded(gui_elements):
     model2_name = gui_elements["model2_var"].get().strip()
     model2_count = int(gui_elements["prompt_count2_var"].get())
     model2_csv = gui_elements["output_file2_var"].get().strip()
-    model2_log_box = gui_elements["model2_log_box"]
+    model2_log = gui_elements["model2_log"]
     progress_bar2 = gui_elements["progress_bar2"]
     reference2_text = gui_elements["reference2_text"].get("1.0", tk.END).strip()
 
     number_of_models = gui_elements["number_of_models_var"].get()
 
-    threads = []
+    # One job per selected model: (label, generate_prompts_for_model kwargs, log)
+    jobs = [("Model #1", dict(
+        model_name=model1_name,
+        num_prompts=model1_count,
+        output_csv=model1_csv,
+        reference_text=reference1_text,
+        use_memory=use_memory,
+        save_mode=save_mode,
+        log=model1_log,
+        progress_bar=progress_bar1,
+        auto_save_every=auto_save_every
+    ), model1_log)]
 
-    # Worker for Model #1
-    def worker1():
-        generate_prompts_for_model(
-            model_name=model1_name,
-            num_prompts=model1_count,
-            output_csv=model1_csv,
-            reference_text=reference1_text,
+    if number_of_models == "two":
+        jobs.append(("Model #2", dict(
+            model_name=model2_name,
+            num_prompts=model2_count,
+            output_csv=model2_csv,
+            reference_text=reference2_text,
             use_memory=use_memory,
             save_mode=save_mode,
-            log_box=model1_log_box,
-            progress_bar=progress_bar1,
-            auto_scroll=auto_scroll,
+            log=model2_log,
+            progress_bar=progress_bar2,
             auto_save_every=auto_save_every
-        )
+        ), model2_log))
 
-    t1 = threading.Thread(target=worker1)
-    threads.append(t1)
-
-    if number_of_models == "two":
-        def worker2():
-            generate_prompts_for_model(
-                model_name=model2_name,
-                num_prompts=model2_count,
-                output_csv=model2_csv,
-                reference_text=reference2_text,
-                use_memory=use_memory,
-                save_mode=save_mode,
-                log_box=model2_log_box,
-                progress_bar=progress_bar2,
-                auto_scroll=auto_scroll,
-                auto_save_every=auto_save_every
-            )
-        t2 = threading.Thread(target=worker2)
-        threads.append(t2)
+    return jobs
 
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+def generate_prompts_threaded(jobs):
+    """
+    Called in background thread. If 'two' models, run each in parallel.
+    """
+    global stop_generation
+    stop_generation = False
 
-    # Indicate finished
-    model1_log_box.insert(tk.END, "[INFO] Generation process finished (Model #1).\n")
-    if auto_scroll:
-        model1_log_box.see(tk.END)
-
-    if number_of_models == "two":
-        model2_log_box.insert(tk.END, "[INFO] Generation process finished (Model #2).\n")
-        if auto_scroll:
-            model2_log_box.see(tk.END)
+    # Workers spend their time waiting on Ollama, so threads overlap fine and
+    # keep sharing ALL_PROMPTS_MEMORY and the log buffers with the GUI
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            executor.submit(generate_prompts_for_model, **kwargs): (label, log)
+            for label, kwargs, log in jobs
+        }
+        for future in as_completed(futures):
+            label, log = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                log.append(f"[ERROR] Generation failed ({label}): {str(e)}\n")
+            # Indicate finished
+            log.append(f"[INFO] Generation process finished ({label}).\n")
 
 def start_generation(gui_elements):
-    thread = threading.Thread(target=generate_prompts_threaded, args=(gui_elements,))
+    # Read the settings here, on the Tk thread, before handing off to the worker
+    jobs = read_generation_jobs(gui_elements)
+    thread = threading.Thread(target=generate_prompts_threaded, args=(jobs,))
     thread.start()
 
 def stop_generation_func():
@@ -616,12 +790,11 @@ def main():
             "use_memory_var": use_memory_var,
             "save_mode_var": save_mode_var,
 
-            "model1_log_box": model1_log_box,
-            "model2_log_box": model2_log_box,
+            "model1_log": model1_log,
+            "model2_log": model2_log,
             "progress_bar1": progress_bar1,
             "progress_bar2": progress_bar2,
 
-            "auto_scroll_var": auto_scroll_var,
             "auto_save_every_var": auto_save_every_var,
             "number_of_models_var": number_of_models_var
         })
@@ -634,9 +807,8 @@ def main():
     reset_button = ttk.Button(
         action_frame, text="Reset Memory",
         command=lambda: reset_memory_func({
-            "model1_log_box": model1_log_box,
-            "model2_log_box": model2_log_box,
-            "auto_scroll_var": auto_scroll_var
+            "model1_log": model1_log,
+            "model2_log": model2_log
         })
     )
     reset_button.pack(side=tk.LEFT, padx=5)
@@ -644,9 +816,8 @@ def main():
     showmem_button = ttk.Button(
         action_frame, text="Show Memory",
         command=lambda: show_memory_func({
-            "model1_log_box": model1_log_box,
-            "model2_log_box": model2_log_box,
-            "auto_scroll_var": auto_scroll_var
+            "model1_log": model1_log,
+            "model2_log": model2_log
         })
     )
     showmem_button.pack(side=tk.LEFT, padx=5)
@@ -690,6 +861,10 @@ def main():
     model2_log_box.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     model2_scrollbar.config(command=model2_log_box.yview)
 
+    # Workers and buttons write to these; flush_logs moves the text into the boxes
+    model1_log = LogBuffer(model1_log_box)
+    model2_log = LogBuffer(model2_log_box)
+
     # ============ Progress Bars ============
     progress_frame = ttk.Frame(container)
     progress_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -699,6 +874,19 @@ def main():
     progress_bar1 = ttk.Progressbar(progress_frame, orient="horizontal", length=450, mode="determinate")
     progress_bar1.pack(side=tk.RIGHT, padx=5)
 
+    # Tk isn't thread-safe: all log box and progress bar writes happen here, batched every 100 ms
+    def flush_logs():
+        while progress_updates:
+            bar, value = progress_updates.popitem()
+            bar["value"] = value
+
+        auto_scroll = (auto_scroll_var.get() == 1)
+        model1_log.flush(auto_scroll)
+        model2_log.flush(auto_scroll)
+        root.after(100, flush_logs)
+
+    flush_logs()
+
     root.mainloop()
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 
 
 
-#ComfyUI_windows_portable\python_embeded ( pip install pandas openpyxl   )
+#ComfyUI_windows_portable\python_embeded ( pip install pandas openpyxl python-calamine   )
 
 
-pip install pandas openpyxl  
+pip install pandas openpyxl python-calamine  
@@ -2,6 +2,13 @@
 import os
 import sys
 
+# str method for each text_mode; "normal" (and anything else) leaves the text as it is
+TEXT_MODE_FUNCTIONS = {
+    "uppercase": str.upper,
+    "lowercase": str.lower,
+    "title": str.title,
+}
+
 class RK_Write_Text:
     @classmethod
     def INPUT_TYPES(cls):
@@ -37,14 +44,8 @@ class RK_Write_Text:
     def process_text(self, input_text, text_mode, prefix, suffix, received_text=None):
         try:
             # Process the input text based on the selected mode
-            if text_mode == "uppercase":
-                formatted_text = input_text.upper()
-            elif text_mode == "lowercase":
-                formatted_text = input_text.lower()
-            elif text_mode == "title":
-                formatted_text = input_text.title()
-            else:  # normal mode
-                formatted_text = input_text
+            convert = TEXT_MODE_FUNCTIONS.get(text_mode)
+            formatted_text = convert(input_text) if convert else input_text  # normal mode returns the same object
 
             # Add prefix and suffix if provided
             if prefix or suffix:
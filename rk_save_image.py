@@ -1,6 +1,8 @@
 import os
+import re
 import json
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import torch
 from PIL import Image
 from PIL.PngImagePlugin import PngInfo
 import folder_paths
@@ -13,6 +15,8 @@ class rk_save_image:
                 "images": ("IMAGE",),
                 "filename_prefix": ("STRING", {"default": "ComfyUI"}),
                 "save_metadata": ("BOOLEAN", {"default": True}),
+                # zlib level: 1 is several times faster than optimize's max-level pass, files a bit larger
+                "compress_level": ("INT", {"default": 1, "min": 0, "max": 9}),
             },
             "hidden": {"prompt": "PROMPT", "extra_pnginfo": "EXTRA_PNGINFO"},
         }
@@ -22,50 +26,58 @@ class rk_save_image:
     OUTPUT_NODE = True
     CATEGORY = "RK_tools_v02"
 
-    def save_images(self, images, filename_prefix="ComfyUI", save_metadata=True, prompt=None, extra_pnginfo=None):
+    def save_images(self, images, filename_prefix="ComfyUI", save_metadata=True, compress_level=1, prompt=None, extra_pnginfo=None):
         output_dir = folder_paths.get_output_directory()
         
-        # Find the highest existing number
-        existing_files = [f for f in os.listdir(output_dir) if f.startswith(filename_prefix) and f.endswith('.png')]
-        highest_num = 0
-        
-        for file in existing_files:
-            try:
-                # Extract number from filename (e.g., "ComfyUI_00001.png" -> 1)
-                num = int(file.split('_')[-1].split('.')[0])
-                highest_num = max(highest_num, num)
-            except:
-                continue
+        # Find the highest existing number in one directory pass
+        # (e.g., "ComfyUI_00001.png" -> 1; only names this node itself would write count)
+        pattern = re.compile(rf"{re.escape(filename_prefix)}_(\d+)\.png")
+        with os.scandir(output_dir) as entries:
+            highest_num = max(
+                (int(m.group(1)) for entry in entries if (m := pattern.fullmatch(entry.name))),
+                default=0
+            )
         
         # Start numbering from the next number
         counter = highest_num + 1
         
+        # The prompt and workflow are the same for every image in the batch:
+        # serialize them once and share the read-only text chunks between saves
+        metadata = PngInfo()
+        if save_metadata:
+            if prompt is not None:
+                metadata.add_text("prompt", json.dumps(prompt))
+            if extra_pnginfo is not None:
+                for x in extra_pnginfo:
+                    metadata.add_text(x, json.dumps(extra_pnginfo[x]))
+        
         results = list()
-        for image in images:
-            i = 255. * image.cpu().numpy()
-            img = Image.fromarray(np.clip(i, 0, 255).astype(np.uint8))
+        futures = []
+        with ThreadPoolExecutor(max_workers=max(1, min(4, len(images)))) as executor:
+            for image in images:
+                # Scale, clip and cast on the image's own device, then copy 8-bit pixels
+                # (a quarter of the float32 data) to the CPU in one go
+                i = image.mul(255.).clamp_(0, 255).to(torch.uint8)
+                img = Image.fromarray(i.cpu().numpy())
             
-            metadata = PngInfo()
-            if save_metadata:
-                if prompt is not None:
-                    metadata.add_text("prompt", json.dumps(prompt))
-                if extra_pnginfo is not None:
-                    for x in extra_pnginfo:
-                        metadata.add_text(x, json.dumps(extra_pnginfo[x]))
+                # Format filename with counter
+                file = f"{filename_prefix}_{counter:05}.png"
+                full_path = os.path.join(output_dir, file)
             
-            # Format filename with counter
-            file = f"{filename_prefix}_{counter:05}.png"
-            full_path = os.path.join(output_dir, file)
+                # Encode and write in the background (zlib and file I/O release the GIL)
+                # while the next image is converted
+                futures.append(executor.submit(img.save, full_path, pnginfo=metadata, compress_level=compress_level))
             
-            # Save the image
-            img.save(full_path, pnginfo=metadata, optimize=True)
-            
-            results.append({
-                "filename": file,
-                "subfolder": "",
-                "type": "output"
-            })
-            counter += 1
+                results.append({
+                    "filename": file,
+                    "subfolder": "",
+                    "type": "output"
+                })
+                counter += 1
+
+        # Raise any save error here instead of losing it in a worker thread
+        for future in futures:
+            future.result()
 
         return {"ui": {"images": results}}
 
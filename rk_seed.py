@@ -4,7 +4,28 @@ import sys
 import random
 import math
 
+def integer_scale(*values):
+    """
+    Smallest power of ten (up to 10**6) that turns every value into a whole
+    number, or None if there isn't one. UI inputs like 0.1 or 2.35 qualify.
+    """
+    for places in range(7):
+        scale = 10 ** places
+        if all(abs(value * scale - round(value * scale)) < 1e-6 for value in values):
+            return scale
+    return None
+
 class RK_seed:
+    # Fixed attribute slots, no per-instance __dict__
+    __slots__ = (
+        "current_index", "current_value", "values_list",
+        "_cache_key", "_values_list", "_values_len", "_n_steps", "_step_ints", "_seq",
+        "_rng", "_uniform", "_seeded",
+    )
+
+    # Bound str.format for each decimal_places choice, so the format spec is parsed once
+    _FLOAT_FORMATS = {places: ("{:." + str(places) + "f}").format for places in range(1, 7)}
+
     @classmethod
     def INPUT_TYPES(cls):
         return {
@@ -65,11 +86,105 @@ class RK_seed:
         self.current_index = 0
         self.current_value = 0.0
         self.values_list = []
+        # Parsed custom values and step count for the last inputs seen;
+        # they only change when the node's settings do, not between loop runs
+        self._cache_key = None
+        self._values_list = None
+        self._values_len = 0
+        self._n_steps = None
+        self._step_ints = None
+        # Loop values already computed for the current settings: { loop_mode: [value, ...] }
+        self._seq = {}
+        # Own generator for "random" mode, seeded from the seed input so a given
+        # seed gives the same values and the global random state is left alone
+        self._rng = random.Random()
+        self._uniform = self._rng.uniform  # bound once, like the rest of the hot path
+        self._seeded = None
 
     def format_float(self, value, decimal_places):
         """Format float to specified decimal places"""
-        format_str = f"{{:.{decimal_places}f}}"
-        return float(format_str.format(value))
+        # Same correctly rounded result as formatting to a string and parsing it back
+        return round(value, decimal_places)
+
+    def loop_fixed(self, seed, loop_mode, start_value, end_value, step_size, decimal_places, custom_values):
+        """Next value from the comma-separated custom_values list"""
+        if not custom_values:
+            return start_value
+        try:
+            # Parse and format custom values (once per settings).
+            # float() accepts surrounding whitespace itself; empty entries
+            # (e.g. from a trailing comma) are skipped
+            if self._values_list is None:
+                self._values_list = [round(float(x), decimal_places)
+                                     for x in custom_values.split(",") if x and not x.isspace()]
+                self._values_len = len(self._values_list)
+            self.values_list = self._values_list
+            return self._values_list[self.current_index % self._values_len]
+        except Exception as e:
+            print(f"Error parsing custom values: {e}")
+            # Fallback to start_value if parsing fails
+            return start_value
+
+    def loop_random(self, seed, loop_mode, start_value, end_value, step_size, decimal_places, custom_values):
+        """Random value between start_value and end_value"""
+        # Reseed only when the seed input changes
+        if seed != self._seeded:
+            self._rng.seed(seed)
+            self._seeded = seed
+        return self.format_float(self._uniform(start_value, end_value), decimal_places)
+
+    def loop_step(self, seed, loop_mode, start_value, end_value, step_size, decimal_places, custom_values):
+        """Next value stepping up from start_value ("increment") or down from end_value ("decrement")"""
+        # Calculate total steps (once per settings). With whole-number multiples
+        # of a common power of ten there is no float round-off in the count or
+        # the values; only the last step that still fits in the range is used
+        if self._n_steps is None:
+            scale = integer_scale(start_value, end_value, step_size)
+            if scale is not None and round(step_size * scale) > 0:
+                start_i = round(start_value * scale)
+                end_i = round(end_value * scale)
+                step_i = round(step_size * scale)
+                self._step_ints = (scale, start_i, end_i, step_i)
+                self._n_steps = (end_i - start_i) // step_i + 1
+            else:
+                total_range = end_value - start_value
+                self._n_steps = int(round(total_range / step_size)) + 1
+        n_steps = self._n_steps
+
+        # Adjust index based on mode
+        adjusted_index = self.current_index % n_steps
+
+        # Each step's value is computed the first time the loop reaches it;
+        # later passes over the same settings just look it up
+        seq = self._seq.setdefault(loop_mode, [])
+        step_ints = self._step_ints
+        while len(seq) <= adjusted_index:
+            if step_ints is not None:
+                scale, start_i, end_i, step_i = step_ints
+                if loop_mode == "increment":
+                    value_i = start_i + len(seq) * step_i
+                else:
+                    value_i = end_i - len(seq) * step_i
+                seq.append(self.format_float(value_i / scale, decimal_places))
+            elif loop_mode == "increment":
+                seq.append(self.format_float(
+                    start_value + (len(seq) * step_size),
+                    decimal_places
+                ))
+            else:
+                seq.append(self.format_float(
+                    end_value - (len(seq) * step_size),
+                    decimal_places
+                ))
+        return seq[adjusted_index]
+
+    # loop_mode -> handler; "disabled" has none and keeps start_value
+    _LOOP_HANDLERS = {
+        "fixed": loop_fixed,
+        "random": loop_random,
+        "increment": loop_step,
+        "decrement": loop_step,
+    }
 
     def process_seed(self, seed, loop_mode, start_value, end_value, step_size, loop_count, decimal_places, custom_values=None):
         try:
@@ -77,77 +192,60 @@ class RK_seed:
             if start_value > end_value:
                 start_value, end_value = end_value, start_value
 
-            seed_dict = {"seed": int(seed)}
+            # Convert the seed once; several outputs share the results
+            seed_int = int(seed)
+            seed_float = float(seed)
+            seed_dict = {"seed": seed_int}
+
+            # Settings changed since the last call: drop the cached values
+            cache_key = (custom_values, start_value, end_value, step_size, decimal_places)
+            if cache_key != self._cache_key:
+                self._cache_key = cache_key
+                self._values_list = None  # parsed on first use in "fixed" mode
+                self._n_steps = None
+                self._step_ints = None
+                self._seq = {}
 
             # Initialize loop value
             loop_value = start_value
 
-            # Process based on loop mode
-            if loop_mode != "disabled":
-                if loop_mode == "fixed" and custom_values:
-                    try:
-                        # Parse and format custom values
-                        self.values_list = [self.format_float(float(x.strip()), decimal_places) 
-                                          for x in custom_values.split(",")]
-                        loop_value = self.values_list[self.current_index % len(self.values_list)]
-                    except Exception as e:
-                        print(f"Error parsing custom values: {e}")
-                        # Fallback to start_value if parsing fails
-                        loop_value = start_value
-
-                elif loop_mode == "random":
-                    loop_value = self.format_float(random.uniform(start_value, end_value), decimal_places)
-
-                elif loop_mode in ["increment", "decrement"]:
-                    # Calculate total steps
-                    total_range = end_value - start_value
-                    n_steps = int(round(total_range / step_size)) + 1
-
-                    # Adjust index based on mode
-                    adjusted_index = self.current_index % n_steps
-
-                    if loop_mode == "increment":
-                        loop_value = self.format_float(
-                            start_value + (adjusted_index * step_size),
-                            decimal_places
-                        )
-                    elif loop_mode == "decrement":
-                        loop_value = self.format_float(
-                            end_value - (adjusted_index * step_size),
-                            decimal_places
-                        )
-
-                    # Increment counter
-                    self.current_index += 1
+            # Process based on loop mode (one handler per looping mode)
+            handler = self._LOOP_HANDLERS.get(loop_mode)
+            if handler is not None:
+                loop_value = handler(self, seed, loop_mode, start_value, end_value, step_size, decimal_places, custom_values)
 
                 # Limit the loop_value to not exceed 100
                 if loop_value > 100.0:
                     loop_value = 100.0
 
-                # Ensure loop_count is not exceeded
-                if self.current_index >= loop_count:
-                    self.current_index = 0
+                # Advance the counter for every looping mode, wrapping after loop_count runs
+                self.current_index = (self.current_index + 1) % loop_count
 
             # Store current value
             self.current_value = loop_value
 
             # Format the string output with specified decimal places
-            loop_value_string = f"{loop_value:.{decimal_places}f}"
+            float_format = self._FLOAT_FORMATS.get(decimal_places)
+            if float_format is not None:
+                loop_value_string = float_format(loop_value)
+            else:
+                loop_value_string = f"{loop_value:.{decimal_places}f}"
 
             return (
                 seed_dict,           # SEED
-                float(seed),         # NUMBER
-                float(seed),         # FLOAT
-                int(seed),           # INT
+                seed_float,          # NUMBER
+                seed_float,          # FLOAT
+                seed_int,            # INT
                 str(seed),           # STRING
-                float(loop_value),   # loop_value
+                float(loop_value),   # loop_value (start_value may arrive as an int from API prompts)
                 self.current_index,  # loop_index
                 loop_value_string    # loop_value_string
             )
 
         except Exception as e:
             print(f"Error in RK_seed: {str(e)}")
-            raise e
+            # Bare raise re-raises the original exception as it is
+            raise
 
 # Node class mappings
 NODE_CLASS_MAPPINGS = {